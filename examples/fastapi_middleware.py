@@ -7,15 +7,26 @@ redacts PII from API responses.
 
 Requirements:
     pip install fastapi uvicorn
+    pip install orjson  # optional, faster JSON handling
 
 Run:
     uvicorn fastapi_middleware:app --reload
 """
 
+import asyncio
 import json
-from typing import Any, Callable
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
-from pii_guard import scan, redact, PIIDetector
+from pii_guard import scan, redact, PIIDetector, get_default_detector
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Note: These imports require fastapi to be installed
 # from fastapi import FastAPI, Request, Response
@@ -23,29 +34,214 @@ from pii_guard import scan, redact, PIIDetector
 # from starlette.middleware.base import BaseHTTPMiddleware
 
 
+# String leaves are redacted together, joined by a run of NUL characters that
+# is wider than the detector's 100-character context window, so a leaf's
+# results never depend on the strings around it.
+_LEAF_SEPARATOR = "\x00" * 128
+
+# Detection cost grows faster than linearly with text length, so leaves are
+# batched into joined strings of roughly this many characters.
+_BATCH_CHARS = 2048
+
+# API payloads repeat the same strings (enum values, messages, user agents),
+# so redactions of short leaves are kept in a bounded LRU shared by all
+# requests. Keys hold the detector itself so results never cross detectors.
+_CACHE_SIZE = 4096
+_CACHEABLE_CHARS = 512
+# JSON bodies larger than this are redacted and sent back in chunks rather
+# than re-encoded into one buffer
+_STREAM_THRESHOLD = 64 * 1024
+_STREAM_CHUNK_BYTES = 64 * 1024
+_STREAM_DEPTH = 2
+
+_redaction_cache: "OrderedDict[Tuple[PIIDetector, str], str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
 def redact_dict(obj: Any, detector: PIIDetector = None) -> Any:
     """
-    Recursively redact PII from a dictionary or list structure.
+    Redact PII from every string inside a dictionary or list structure.
+
+    The structure is copied with an explicit stack rather than recursion.
+    Containers that appear more than once, or refer to themselves, are
+    copied once and keep their shape in the result.
+    String leaves are redacted in batches, and each distinct short string is
+    redacted once and then served from a bounded cache.
 
     Args:
         obj: The object to redact (dict, list, or string)
-        detector: Optional PIIDetector instance (creates one if not provided)
+        detector: Optional PIIDetector instance (uses the shared default if not provided)
 
     Returns:
         The object with PII redacted from string values
     """
     if detector is None:
-        detector = PIIDetector()
-
-    if isinstance(obj, str):
-        redacted, _ = detector.redact(obj)
-        return redacted
-    elif isinstance(obj, dict):
-        return {k: redact_dict(v, detector) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [redact_dict(item, detector) for item in obj]
+        detector = get_default_detector()
+
+    root = [obj]
+    stack = [(root, 0)]
+    slots = []
+    leaves = []
+    # Copies by id() of the container they were made from, so a container
+    # reached twice, including through a reference to itself, is copied once
+    copies = {}
+    while stack:
+        parent, key = stack.pop()
+        node = parent[key]
+        if isinstance(node, str):
+            slots.append((parent, key))
+            leaves.append(node)
+        elif isinstance(node, (dict, list)):
+            copy = copies.get(id(node))
+            if copy is not None:
+                parent[key] = copy
+            elif isinstance(node, dict):
+                copy = copies[id(node)] = parent[key] = dict(node)
+                stack.extend((copy, k) for k in copy)
+            else:
+                copy = copies[id(node)] = parent[key] = list(node)
+                stack.extend((copy, i) for i in range(len(copy)))
+
+    # Look repeated strings up in the cache and redact each distinct miss once
+    redacted = [None] * len(leaves)
+    pending = {}
+    with _cache_lock:
+        for i, leaf in enumerate(leaves):
+            if not leaf or leaf.isspace():
+                redacted[i] = leaf
+                continue
+            if len(leaf) <= _CACHEABLE_CHARS:
+                hit = _redaction_cache.get((detector, leaf))
+                if hit is not None:
+                    _redaction_cache.move_to_end((detector, leaf))
+                    redacted[i] = hit
+                    continue
+            pending.setdefault(leaf, []).append(i)
+
+    texts = list(pending)
+    results = _redact_leaves(texts, detector)
+
+    with _cache_lock:
+        for text, result in zip(texts, results):
+            for i in pending[text]:
+                redacted[i] = result
+            if len(text) <= _CACHEABLE_CHARS:
+                _redaction_cache[(detector, text)] = result
+        while len(_redaction_cache) > _CACHE_SIZE:
+            _redaction_cache.popitem(last=False)
+
+    for (parent, key), value in zip(slots, redacted):
+        parent[key] = value
+
+    return root[0]
+
+
+def _json_loads(body: bytes) -> Tuple[Any, Callable[[Any], bytes]]:
+    """
+    Parse JSON with orjson when available, falling back to the stdlib.
+
+    Returns the parsed data together with the serializer to write it back
+    with. A body only the stdlib accepts (e.g. one containing NaN or
+    Infinity) is written back with the stdlib too, since orjson would turn
+    non-finite floats into null.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(body), _json_dumps
+        except orjson.JSONDecodeError:
+            pass  # e.g. integers wider than 64 bits or NaN; let json decide
+    return json.loads(body), _stdlib_json_dumps
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes with orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits
+    return _stdlib_json_dumps(data)
+
+
+def _stdlib_json_dumps(data: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes with the stdlib, keeping NaN and Infinity."""
+    return json.dumps(data).encode()
+
+
+def _clear_redaction_cache() -> None:
+    """Drop all cached leaf redactions."""
+    with _cache_lock:
+        _redaction_cache.clear()
+
+
+def _redact_leaves(leaves: List[str], detector: PIIDetector) -> List[str]:
+    """Redact strings in batches of about _BATCH_CHARS characters."""
+    if any("\x00" in leaf for leaf in leaves):
+        # The separator could collide with the data; redact leaf by leaf
+        return [detector.redact(leaf)[0] for leaf in leaves]
+
+    redacted = []
+    batch = []
+    size = 0
+    for leaf in leaves:
+        batch.append(leaf)
+        size += len(leaf)
+        if size >= _BATCH_CHARS:
+            redacted.extend(_redact_batch(batch, detector))
+            batch = []
+            size = 0
+    if batch:
+        redacted.extend(_redact_batch(batch, detector))
+    return redacted
+
+
+def _iter_redacted_json(
+    node: Any,
+    detector: PIIDetector,
+    dumps: Callable[[Any], bytes] = _json_dumps,
+    depth: int = 0,
+) -> Iterator[bytes]:
+    """
+    Yield the redacted JSON encoding of a parsed document piece by piece.
+
+    The outer levels of arrays and objects are walked here; anything deeper
+    is redacted and encoded as one unit, so a large list response is produced
+    item by item instead of as one big copy. Every piece is encoded with
+    ``dumps``.
+    """
+    if depth < _STREAM_DEPTH and isinstance(node, list):
+        yield b"["
+        for i, item in enumerate(node):
+            if i:
+                yield b","
+            yield from _iter_redacted_json(item, detector, dumps, depth + 1)
+        yield b"]"
+    elif depth < _STREAM_DEPTH and isinstance(node, dict):
+        yield b"{"
+        for i, (key, value) in enumerate(node.items()):
+            yield (b"," if i else b"") + dumps(key) + b":"
+            yield from _iter_redacted_json(value, detector, dumps, depth + 1)
+        yield b"}"
     else:
-        return obj
+        yield dumps(redact_dict(node, detector))
+
+
+def _next_chunk(pieces: Iterator[bytes]) -> bytes:
+    """Collect encoded pieces until roughly _STREAM_CHUNK_BYTES are ready."""
+    chunk = bytearray()
+    for piece in pieces:
+        chunk += piece
+        if len(chunk) >= _STREAM_CHUNK_BYTES:
+            break
+    return bytes(chunk)
+
+
+def _redact_batch(leaves: List[str], detector: PIIDetector) -> List[str]:
+    """Redact several strings with one detector call."""
+    if len(leaves) == 1:
+        return [detector.redact(leaves[0])[0]]
+    joined, _ = detector.redact(_LEAF_SEPARATOR.join(leaves))
+    return joined.split(_LEAF_SEPARATOR)
 
 
 class PIIRedactionMiddleware:
@@ -75,67 +271,142 @@ class PIIRedactionMiddleware:
             exclude_paths: List of paths to exclude from redaction (e.g., ["/health"])
         """
         self.app = app
-        self.exclude_paths = exclude_paths or []
-        self.detector = PIIDetector()
+        # A tuple lets str.startswith test every prefix in one call
+        self.exclude_paths = tuple(exclude_paths or ())
+        # One detector is shared by all worker threads rather than one per
+        # worker: its compiled patterns are built up front and only read
+        # afterwards, so a copy per thread would just repeat that work
+        self.detector = get_default_detector()
+        # Redaction is CPU-bound; run it off the event loop. The pool is shut
+        # down when the application's lifespan ends, or by close()
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+    def close(self) -> None:
+        """Shut down the worker threads without waiting for queued redactions."""
+        self._executor.shutdown(wait=False)
+
+    def __del__(self):
+        """Release the worker threads if close() was never called."""
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _redact_body(self, body: bytes) -> Optional[bytes]:
+        """Redact a JSON response body, or return None if it is not valid JSON."""
+        try:
+            data, dumps = _json_loads(body)
+        except json.JSONDecodeError:
+            return None
+        return dumps(redact_dict(data, self.detector))
+
+    def _start_streaming(self, body: bytes) -> Optional[Iterator[bytes]]:
+        """Parse a large JSON body and return a lazy iterator over its redacted encoding."""
+        try:
+            data, dumps = _json_loads(body)
+        except json.JSONDecodeError:
+            return None
+        return _iter_redacted_json(data, self.detector, dumps)
+
+    async def _send_streamed(self, send, initial_message: dict, pieces: Iterator[bytes]):
+        """Send a redacted body in chunks as the worker thread produces them."""
+        # The final length is unknown up front; the server falls back to
+        # chunked transfer encoding without a content-length header
+        initial_message["headers"] = [
+            (header_name, header_value)
+            for header_name, header_value in initial_message.get("headers", [])
+            if header_name != b"content-length"
+        ]
+        await send(initial_message)
+
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await loop.run_in_executor(self._executor, _next_chunk, pieces)
+            if not chunk:
+                break
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
 
     async def __call__(self, scope, receive, send):
         """ASGI middleware interface."""
+        if scope["type"] == "lifespan":
+            async def lifespan_send(message):
+                await send(message)
+                if message["type"] == "lifespan.shutdown.complete":
+                    self.close()
+
+            await self.app(scope, receive, lifespan_send)
+            return
+
         if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
         # Check if path is excluded
         path = scope.get("path", "")
-        if any(path.startswith(excluded) for excluded in self.exclude_paths):
+        if self.exclude_paths and path.startswith(self.exclude_paths):
             await self.app(scope, receive, send)
             return
 
         # Intercept response
-        response_body = []
-        response_started = False
+        response_body = bytearray()
+        is_json = False
         initial_message = {}
 
         async def send_wrapper(message):
-            nonlocal response_started, initial_message
+            nonlocal is_json, initial_message
 
             if message["type"] == "http.response.start":
-                initial_message = message
-                response_started = True
+                # Check if JSON response before any body arrives
+                content_type = b""
+                for header_name, header_value in message.get("headers", []):
+                    if header_name == b"content-type":
+                        content_type = header_value
+                        break
+                is_json = b"application/json" in content_type
+
+                if is_json:
+                    initial_message = message
+                else:
+                    # Nothing to redact; stream the response straight through
+                    await send(message)
                 return
 
-            if message["type"] == "http.response.body":
-                body = message.get("body", b"")
-                response_body.append(body)
+            if message["type"] == "http.response.body" and is_json:
+                response_body.extend(message.get("body", b""))
 
                 # Check if this is the last chunk
                 if not message.get("more_body", False):
-                    # Combine all body chunks
-                    full_body = b"".join(response_body)
-
-                    # Check if JSON response
-                    content_type = ""
-                    for header_name, header_value in initial_message.get("headers", []):
-                        if header_name == b"content-type":
-                            content_type = header_value.decode()
-                            break
-
-                    if "application/json" in content_type:
-                        try:
-                            data = json.loads(full_body)
-                            redacted_data = redact_dict(data, self.detector)
-                            full_body = json.dumps(redacted_data).encode()
-
-                            # Update content-length header
-                            new_headers = []
-                            for header_name, header_value in initial_message.get("headers", []):
-                                if header_name == b"content-length":
-                                    new_headers.append((b"content-length", str(len(full_body)).encode()))
-                                else:
-                                    new_headers.append((header_name, header_value))
-                            initial_message["headers"] = new_headers
-
-                        except json.JSONDecodeError:
-                            pass  # Not valid JSON, pass through
+                    full_body = bytes(response_body)
+                    response_body.clear()
+                    loop = asyncio.get_running_loop()
+
+                    if len(full_body) > _STREAM_THRESHOLD:
+                        pieces = await loop.run_in_executor(
+                            self._executor, self._start_streaming, full_body
+                        )
+                        if pieces is not None:
+                            del full_body
+                            await self._send_streamed(send, initial_message, pieces)
+                            return
+                        redacted_body = None
+                    else:
+                        redacted_body = await loop.run_in_executor(
+                            self._executor, self._redact_body, full_body
+                        )
+
+                    # None means the body was not valid JSON; pass it through
+                    if redacted_body is not None:
+                        full_body = redacted_body
+
+                        # Update content-length header in place; a dict would
+                        # collapse repeated headers such as set-cookie
+                        content_length = str(len(full_body)).encode()
+                        initial_message["headers"] = [
+                            (header_name, content_length)
+                            if header_name == b"content-length"
+                            else (header_name, header_value)
+                            for header_name, header_value in initial_message.get("headers", [])
+                        ]
 
                     # Send the start message first
                     await send(initial_message)
@@ -148,6 +419,8 @@ class PIIRedactionMiddleware:
                     })
                 return
 
+            await send(message)
+
         await self.app(scope, receive, send_wrapper)
 
 
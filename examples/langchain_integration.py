@@ -9,7 +9,7 @@ Requirements:
     pip install langchain langchain-openai
 """
 
-from pii_guard import scan, redact, PIIDetector
+from pii_guard import scan, redact, get_default_detector
 
 # Note: These imports require langchain to be installed
 # Uncomment when using with actual LangChain
@@ -36,14 +36,15 @@ class PIIRedactingParser:
 
     def __init__(self, mask_char: str = "*"):
         self.mask_char = mask_char
-        self.detector = PIIDetector()
+        self.detector = get_default_detector()
 
     def parse(self, text: str) -> str:
         """Parse and redact PII from the output."""
-        if hasattr(text, 'content'):
-            # Handle AIMessage objects
-            text = text.content
-        redacted, _ = self.detector.redact(str(text), self.mask_char)
+        # Handle AIMessage objects
+        text = getattr(text, 'content', text)
+        if type(text) is not str:
+            text = str(text)
+        redacted, _ = self.detector.redact(text, self.mask_char)
         return redacted
 
     def __call__(self, text):
@@ -62,30 +63,34 @@ class PIIScanningParser:
     def __init__(self, min_confidence: float = 0.9, allowed_types: list = None):
         self.min_confidence = min_confidence
         self.allowed_types = allowed_types or []
-        self.detector = PIIDetector()
+        self._allowed_set = frozenset(self.allowed_types)
+        self.detector = get_default_detector()
 
     def parse(self, text: str) -> str:
         """Check for PII and raise error if found."""
-        if hasattr(text, 'content'):
-            text = text.content
-
-        entities = self.detector.detect(str(text))
-
-        # Filter by confidence and allowed types
-        violations = [
-            e for e in entities
-            if e.confidence >= self.min_confidence
-            and e.label not in self.allowed_types
-        ]
-
-        if violations:
-            types_found = list(set(e.label for e in violations))
+        text = getattr(text, 'content', text)
+        if type(text) is not str:
+            text = str(text)
+
+        entities = self.detector.detect(text)
+
+        # Stop at the first entity above the threshold that is not allowed
+        violation = next(
+            (
+                e for e in entities
+                if e.confidence >= self.min_confidence
+                and e.label not in self._allowed_set
+            ),
+            None,
+        )
+
+        if violation is not None:
             raise ValueError(
-                f"PII detected in response: {types_found}. "
-                f"Found {len(violations)} entities."
+                f"PII detected in response: {violation.label} "
+                f"at position {violation.start}."
             )
 
-        return str(text)
+        return text
 
     def __call__(self, text):
         return self.parse(text)
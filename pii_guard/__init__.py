@@ -42,18 +42,38 @@ For more control, use the PIIDetector class directly:
 __version__ = "0.1.0"
 __author__ = "PII Guard Contributors"
 
+from typing import TYPE_CHECKING, Any
+
 from .entities import PIIEntity, EntityType
-from .detector import PIIDetector, EnhancedMLPIIDetector
-from .anonymizer import (
-    DataAnonymizer,
-    AnonymizationMethod,
-    AnonymizationConfig,
-    FieldConfig,
-    TableConfig,
-    TokenVault,
-    AnonymizationTemplates,
-)
-from .fake_data import FakeDataGenerator, get_fake_generator
+
+if TYPE_CHECKING:
+    from .detector import PIIDetector, EnhancedMLPIIDetector
+    from .anonymizer import (
+        DataAnonymizer,
+        AnonymizationMethod,
+        AnonymizationConfig,
+        FieldConfig,
+        TableConfig,
+        TokenVault,
+        AnonymizationTemplates,
+    )
+    from .fake_data import FakeDataGenerator, get_fake_generator
+
+# Public names imported from their submodule on first access (PEP 562), so
+# that e.g. `pii-guard entities` does not compile every detector pattern
+_LAZY_ATTRS = {
+    "PIIDetector": ".detector",
+    "EnhancedMLPIIDetector": ".detector",
+    "DataAnonymizer": ".anonymizer",
+    "AnonymizationMethod": ".anonymizer",
+    "AnonymizationConfig": ".anonymizer",
+    "FieldConfig": ".anonymizer",
+    "TableConfig": ".anonymizer",
+    "TokenVault": ".anonymizer",
+    "AnonymizationTemplates": ".anonymizer",
+    "FakeDataGenerator": ".fake_data",
+    "get_fake_generator": ".fake_data",
+}
 
 __all__ = [
     # Core classes
@@ -75,18 +95,49 @@ __all__ = [
     "scan",
     "redact",
     "list_entities",
+    "get_default_detector",
     # Backwards compatibility
     "EnhancedMLPIIDetector",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
 # Module-level detector instance (lazy loaded)
 _default_detector = None
 
 
-def _get_detector() -> PIIDetector:
-    """Get or create the default detector instance."""
+def get_default_detector() -> "PIIDetector":
+    """
+    Get the shared detector instance used by scan() and redact().
+
+    The detector is created on first use. It holds no per-call state, so
+    integrations can share it instead of constructing their own.
+
+    Returns:
+        The process-wide PIIDetector instance
+
+    Example:
+        >>> from pii_guard import get_default_detector
+        >>> detector = get_default_detector()
+        >>> redacted, entities = detector.redact("SSN: 123-45-6789")
+    """
     global _default_detector
     if _default_detector is None:
+        from .detector import PIIDetector
         _default_detector = PIIDetector()
     return _default_detector
 
@@ -112,7 +163,7 @@ def scan(text: str) -> list[PIIEntity]:
         EMAIL: john@example.com
         PHONE: 555-1234
     """
-    return _get_detector().detect(text)
+    return get_default_detector().detect(text)
 
 
 def redact(text: str, mask_char: str = "*") -> str:
@@ -134,7 +185,7 @@ def redact(text: str, mask_char: str = "*") -> str:
         >>> print(clean)
         Email: [EMAIL:****], SSN: [SSN:****]
     """
-    redacted, _ = _get_detector().redact(text, mask_char)
+    redacted, _ = get_default_detector().redact(text, mask_char)
     return redacted
 
 
@@ -151,4 +202,8 @@ def list_entities() -> list[str]:
         >>> print(types[:5])
         ['SSN', 'CREDIT_CARD', 'IBAN', 'BITCOIN_ADDRESS', 'ETHEREUM_ADDRESS']
     """
-    return [e.value for e in EntityType]
+    return list(_ENTITY_TYPES)
+
+
+# Entity type names never change at runtime; build the tuple once
+_ENTITY_TYPES = tuple(e.value for e in EntityType)
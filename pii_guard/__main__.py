@@ -0,0 +1,5 @@
+"""Allow ``python -m pii_guard`` to run the CLI."""
+
+from pii_guard.cli import main
+
+raise SystemExit(main())
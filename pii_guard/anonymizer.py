@@ -20,19 +20,63 @@ Features:
 import hashlib
 import uuid
 import re
-import json
 import random
 import string
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
 from enum import Enum
+from collections import Counter
+from itertools import chain, islice
 from abc import ABC, abstractmethod
 import base64
 
 logger = logging.getLogger(__name__)
 
+# Patterns and tables shared by the anonymizers, built once at import
+_NON_DIGIT_RE = re.compile(r'\D')
+_ZIP_RE = re.compile(r'\b\d{5}(?:-\d{4})?\b')
+_ALNUM_MASK_TABLE = str.maketrans({c: '*' for c in string.ascii_letters + string.digits})
+
+# Sentinel for consistency-map misses, since None is a valid cached value
+_MISSING = object()
+
+# Types whose equal values always render the same, so they can key the cache as-is
+_SELF_KEYED_TYPES = frozenset({int, bool, date})
+
+
+def _cache_key(value: Any) -> Any:
+    """
+    Build the consistency-cache key for a value.
+
+    Strings key themselves. int, bool and date values are tagged with their
+    type so that 1, True and "1" stay apart without a str() call. Anything
+    else is keyed by (type, str(value)), since equal values of those types
+    can render differently (aware datetimes, -0.0, Decimal precision).
+    """
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type in _SELF_KEYED_TYPES:
+        return (value_type, value)
+    return (value_type, str(value))
+
+
+# Single-value anonymizer with its FieldConfig already applied: fn(value, context)
+SpecializedAnonymizer = Callable[[Any, Optional[Dict[str, Any]]], Any]
+
+
+def _det_rand(value: str) -> int:
+    """
+    Derive a deterministic 64-bit integer from a value.
+
+    FAKE methods draw every choice from this number (via divmod) instead of
+    reseeding the global random module, so the same input always maps to
+    the same fake output and anonymizers are safe to use from several threads.
+    """
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "little")
+
 
 class AnonymizationMethod(Enum):
     """Methods for anonymizing data."""
@@ -46,6 +90,10 @@ class AnonymizationMethod(Enum):
     NULL = "null"  # Replace with null
     PRESERVE = "preserve"  # Keep original (for non-sensitive fields)
 
+    # Members are singletons compared by identity, so hash by identity too.
+    # Enum.__hash__ is implemented in Python and dominated dispatch-table lookups.
+    __hash__ = object.__hash__
+
 
 @dataclass
 class FieldConfig:
@@ -153,247 +201,413 @@ class TokenVault:
 
     def __init__(self, encryption_key: Optional[str] = None):
         self.encryption_key = encryption_key or self._generate_key()
-        self._vault: Dict[str, Dict[str, str]] = {}  # {field_type: {hash: token}}
-        self._reverse: Dict[str, Dict[str, str]] = {}  # {field_type: {token: original}}
+        self._vault: Dict[Tuple[str, bytes], str] = {}  # {(field_type, hash): token}
+        self._reverse: Dict[Tuple[str, str], str] = {}  # {(field_type, token): original}
 
     def _generate_key(self) -> str:
         return base64.b64encode(uuid.uuid4().bytes).decode()
 
     def tokenize(self, value: str, field_type: str) -> str:
         """Tokenize a value (reversible)."""
-        if field_type not in self._vault:
-            self._vault[field_type] = {}
-            self._reverse[field_type] = {}
-
-        value_hash = hashlib.sha256(value.encode()).hexdigest()[:16]
+        key = (field_type, hashlib.sha256(value.encode()).digest()[:8])
 
-        if value_hash in self._vault[field_type]:
-            return self._vault[field_type][value_hash]
+        token = self._vault.get(key)
+        if token is not None:
+            return token
 
         token = f"TOK_{field_type.upper()}_{uuid.uuid4().hex[:12]}"
 
-        self._vault[field_type][value_hash] = token
-        self._reverse[field_type][token] = value
+        self._vault[key] = token
+        self._reverse[(field_type, token)] = value
 
         return token
 
     def detokenize(self, token: str, field_type: str) -> Optional[str]:
         """Reverse a token to original value."""
-        if field_type not in self._reverse:
-            return None
-        return self._reverse[field_type].get(token)
+        return self._reverse.get((field_type, token))
 
     def export_vault(self) -> Dict[str, Any]:
         """Export vault for secure storage."""
+        vault: Dict[str, Dict[str, str]] = {}
+        for (field_type, value_hash), token in self._vault.items():
+            vault.setdefault(field_type, {})[value_hash.hex()] = token
+
+        reverse: Dict[str, Dict[str, str]] = {}
+        for (field_type, token), value in self._reverse.items():
+            reverse.setdefault(field_type, {})[token] = value
+
         return {
-            "vault": self._vault,
-            "reverse": self._reverse,
+            "vault": vault,
+            "reverse": reverse,
         }
 
     def import_vault(self, data: Dict[str, Any]):
         """Import vault from storage."""
-        self._vault = data.get("vault", {})
-        self._reverse = data.get("reverse", {})
+        self._vault = {
+            (field_type, bytes.fromhex(value_hash)): token
+            for field_type, hashes in data.get("vault", {}).items()
+            for value_hash, token in hashes.items()
+        }
+        self._reverse = {
+            (field_type, token): value
+            for field_type, tokens in data.get("reverse", {}).items()
+            for token, value in tokens.items()
+        }
+
+
+def _mask_digits(text: str, show_last: int, mask_char: str) -> str:
+    """Mask all but the last show_last digits of text, dropping non-digits."""
+    digits = _NON_DIGIT_RE.sub('', text)
+    if len(digits) > show_last:
+        return mask_char * (len(digits) - show_last) + digits[-show_last:]
+    return mask_char * len(digits)
+
+
+def _specialize_digit_mask(config: FieldConfig) -> SpecializedAnonymizer:
+    """Build a MASK function for digit fields that skips method dispatch."""
+    params = config.params
+
+    def mask(value: Any, context: Optional[Dict[str, Any]] = None) -> Any:
+        if value is None:
+            return None
+        return _mask_digits(str(value), params.get("show_last", 4), params.get("mask_char", "*"))
+
+    return mask
 
 
 class Anonymizer(ABC):
     """Base class for field anonymizers."""
 
     @abstractmethod
-    def anonymize(self, value: Any, config: FieldConfig, context: Dict[str, Any] = None) -> Any:
+    def anonymize(self, value: Any, config: FieldConfig, context: Optional[Dict[str, Any]] = None) -> Any:
         """Anonymize a value according to the config."""
         pass
 
+    def anonymize_column(
+        self,
+        values: List[Any],
+        config: FieldConfig,
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        """
+        Anonymize a column of values that share the same config.
 
-class EmailAnonymizer(Anonymizer):
-    """Anonymize email addresses."""
+        The default applies build_specialized(config) to each value;
+        subclasses can override it to do per-column work once instead of
+        once per value.
+        """
+        anonymize = self.build_specialized(config)
+        return [anonymize(value, context) for value in values]
 
-    def anonymize(self, value: Any, config: FieldConfig, context: Dict[str, Any] = None) -> Any:
-        if value is None:
-            return None
+    def build_specialized(self, config: FieldConfig) -> SpecializedAnonymizer:
+        """
+        Build a single-value anonymizer with config baked in.
+
+        The default simply forwards to anonymize(). Subclasses can return a
+        closure with the method dispatch resolved up front, for configs
+        that are applied to many values. The closure must read
+        config.params when called, so that it stays in step with
+        anonymize() if the params are changed later.
+        """
+        anonymize = self.anonymize
 
-        email = str(value)
-        method = config.method
+        def specialized(value: Any, context: Optional[Dict[str, Any]] = None) -> Any:
+            return anonymize(value, config, context)
 
-        if method == AnonymizationMethod.REDACT:
-            return "[EMAIL_REDACTED]"
+        return specialized
 
-        elif method == AnonymizationMethod.MASK:
-            if "@" in email:
-                local, domain = email.split("@", 1)
-                masked_local = local[0] + "***" if len(local) > 1 else "***"
-                return f"{masked_local}@{domain}"
-            return "***@***.***"
 
-        elif method == AnonymizationMethod.HASH:
-            hash_val = hashlib.sha256(email.encode()).hexdigest()[:12]
-            return f"anon_{hash_val}@example.com"
+class EmailAnonymizer(Anonymizer):
+    """Anonymize email addresses."""
 
-        elif method == AnonymizationMethod.FAKE:
-            seed = int(hashlib.md5(email.encode()).hexdigest()[:8], 16)
-            random.seed(seed)
-            fake_name = ''.join(random.choices(string.ascii_lowercase, k=8))
-            fake_domain = random.choice(["example.com", "test.org", "sample.net"])
-            return f"{fake_name}@{fake_domain}"
+    FAKE_DOMAINS = ("example.com", "test.org", "sample.net")
+
+    def __init__(self) -> None:
+        self._dispatch = {
+            AnonymizationMethod.REDACT: self._redact,
+            AnonymizationMethod.MASK: self._mask,
+            AnonymizationMethod.HASH: self._hash,
+            AnonymizationMethod.FAKE: self._fake,
+            AnonymizationMethod.TOKENIZE: self._tokenize,
+        }
+
+    def anonymize(self, value: Any, config: FieldConfig, context: Optional[Dict[str, Any]] = None) -> Any:
+        if value is None:
+            return None
 
-        elif method == AnonymizationMethod.TOKENIZE:
-            vault = context.get("vault") if context else None
-            if vault:
-                return vault.tokenize(email, "email")
-            return f"TOK_EMAIL_{hashlib.md5(email.encode()).hexdigest()[:12]}"
+        return self._dispatch.get(config.method, self._redact)(str(value), config, context)
 
+    def _redact(self, email: str, config: FieldConfig, context: Optional[Dict[str, Any]]) -> str:
         return "[EMAIL_REDACTED]"
 
+    def _mask(self, email: str, config: FieldConfig, context: Optional[Dict[str, Any]]) -> str:
+        if "@" in email:
+            local, domain = email.split("@", 1)
+            masked_local = local[0] + "***" if len(local) > 1 else "***"
+            return f"{masked_local}@{domain}"
+        return "***@***.***"
+
+    def _hash(self, email: str, config: FieldConfig, context: Optional[Dict[str, Any]]) -> str:
+        hash_val = hashlib.sha256(email.encode()).digest()[:6].hex()
+        return f"anon_{hash_val}@example.com"
+
+    def _fake(self, email: str, config: FieldConfig, context: Optional[Dict[str, Any]]) -> str:
+        h = _det_rand(email)
+        # Eight base-26 digits for the name, domain from what is left
+        letters = []
+        for _ in range(8):
+            h, i = divmod(h, 26)
+            letters.append(string.ascii_lowercase[i])
+        fake_domain = self.FAKE_DOMAINS[h % len(self.FAKE_DOMAINS)]
+        return f"{''.join(letters)}@{fake_domain}"
+
+    def _tokenize(self, email: str, config: FieldConfig, context: Optional[Dict[str, Any]]) -> str:
+        vault: Optional[TokenVault] = context.get("vault") if context else None
+        if vault:
+            return vault.tokenize(email, "email")
+        return f"TOK_EMAIL_{hashlib.md5(email.encode()).digest()[:6].hex()}"
+
 
 class PhoneAnonymizer(Anonymizer):
     """Anonymize phone numbers."""
 
-    def anonymize(self, value: Any, config: FieldConfig, context: Dict[str, Any] = None) -> Any:
+    def __init__(self) -> None:
+        self._dispatch = {
+            AnonymizationMethod.REDACT: self._redact,
+            AnonymizationMethod.MASK: self._mask,
+            AnonymizationMethod.HASH: self._hash,
+            AnonymizationMethod.FAKE: self._fake,
+        }
+
+    def anonymize(self, value: Any, config: FieldConfig, context: Optional[Dict[str, Any]] = None) -> Any:
         if value is None:
             return None
 
-        phone = str(value)
-        digits = re.sub(r'\D', '', phone)
-        method = config.method
+        return self._dispatch.get(config.method, self._redact)(str(value), config)
 
-        if method == AnonymizationMethod.REDACT:
-            return "[PHONE_REDACTED]"
+    def build_specialized(self, config: FieldConfig) -> SpecializedAnonymizer:
+        if config.method is AnonymizationMethod.MASK:
+            return _specialize_digit_mask(config)
+        return super().build_specialized(config)
 
-        elif method == AnonymizationMethod.MASK:
-            show_last = config.params.get("show_last", 4)
-            mask_char = config.params.get("mask_char", "*")
-            if len(digits) > show_last:
-                return mask_char * (len(digits) - show_last) + digits[-show_last:]
-            return mask_char * len(digits)
+    def _redact(self, phone: str, config: FieldConfig) -> str:
+        return "[PHONE_REDACTED]"
 
-        elif method == AnonymizationMethod.HASH:
-            hash_val = hashlib.sha256(phone.encode()).hexdigest()[:10]
-            return f"+1{hash_val}"
+    def _mask(self, phone: str, config: FieldConfig) -> str:
+        return _mask_digits(phone, config.params.get("show_last", 4), config.params.get("mask_char", "*"))
 
-        elif method == AnonymizationMethod.FAKE:
-            seed = int(hashlib.md5(phone.encode()).hexdigest()[:8], 16)
-            random.seed(seed)
-            area = random.randint(200, 999)
-            exchange = random.randint(200, 999)
-            subscriber = random.randint(1000, 9999)
-            return f"+1-{area}-{exchange}-{subscriber}"
+    def _hash(self, phone: str, config: FieldConfig) -> str:
+        hash_val = hashlib.sha256(phone.encode()).digest()[:5].hex()
+        return f"+1{hash_val}"
 
-        return "[PHONE_REDACTED]"
+    def _fake(self, phone: str, config: FieldConfig) -> str:
+        h, area = divmod(_det_rand(phone), 800)
+        h, exchange = divmod(h, 800)
+        subscriber = h % 9000
+        return f"+1-{200 + area}-{200 + exchange}-{1000 + subscriber}"
 
 
 class NameAnonymizer(Anonymizer):
     """Anonymize names."""
 
-    FAKE_FIRST_NAMES = ["John", "Jane", "Alex", "Sam", "Chris", "Pat", "Jordan", "Taylor", "Morgan", "Casey"]
-    FAKE_LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Wilson", "Moore"]
+    FAKE_FIRST_NAMES = ("John", "Jane", "Alex", "Sam", "Chris", "Pat", "Jordan", "Taylor", "Morgan", "Casey")
+    FAKE_LAST_NAMES = ("Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Wilson", "Moore")
+
+    def __init__(self) -> None:
+        self._dispatch = {
+            AnonymizationMethod.REDACT: self._redact,
+            AnonymizationMethod.MASK: self._mask,
+            AnonymizationMethod.HASH: self._hash,
+            AnonymizationMethod.FAKE: self._fake,
+        }
 
-    def anonymize(self, value: Any, config: FieldConfig, context: Dict[str, Any] = None) -> Any:
+    def anonymize(self, value: Any, config: FieldConfig, context: Optional[Dict[str, Any]] = None) -> Any:
         if value is None:
             return None
 
-        name = str(value)
-        method = config.method
-
-        if method == AnonymizationMethod.REDACT:
-            return "[NAME_REDACTED]"
+        return self._dispatch.get(config.method, self._redact)(str(value))
 
-        elif method == AnonymizationMethod.MASK:
-            parts = name.split()
-            masked = [p[0] + "***" if len(p) > 1 else "***" for p in parts]
-            return " ".join(masked)
+    def _redact(self, name: str) -> str:
+        return "[NAME_REDACTED]"
 
-        elif method == AnonymizationMethod.HASH:
-            hash_val = hashlib.sha256(name.encode()).hexdigest()[:8]
-            return f"User_{hash_val}"
+    def _mask(self, name: str) -> str:
+        parts = name.split()
+        masked = [p[0] + "***" if len(p) > 1 else "***" for p in parts]
+        return " ".join(masked)
 
-        elif method == AnonymizationMethod.FAKE:
-            seed = int(hashlib.md5(name.encode()).hexdigest()[:8], 16)
-            random.seed(seed)
-            first = random.choice(self.FAKE_FIRST_NAMES)
-            last = random.choice(self.FAKE_LAST_NAMES)
-            return f"{first} {last}"
+    def _hash(self, name: str) -> str:
+        hash_val = hashlib.sha256(name.encode()).digest()[:4].hex()
+        return f"User_{hash_val}"
 
-        return "[NAME_REDACTED]"
+    def _fake(self, name: str) -> str:
+        h, first = divmod(_det_rand(name), len(self.FAKE_FIRST_NAMES))
+        last = h % len(self.FAKE_LAST_NAMES)
+        return f"{self.FAKE_FIRST_NAMES[first]} {self.FAKE_LAST_NAMES[last]}"
 
 
 class SSNAnonymizer(Anonymizer):
     """Anonymize Social Security Numbers."""
 
-    def anonymize(self, value: Any, config: FieldConfig, context: Dict[str, Any] = None) -> Any:
+    def __init__(self) -> None:
+        self._dispatch = {
+            AnonymizationMethod.REDACT: self._redact,
+            AnonymizationMethod.MASK: self._mask,
+            AnonymizationMethod.HASH: self._hash,
+            AnonymizationMethod.FAKE: self._fake,
+        }
+
+    def anonymize(self, value: Any, config: FieldConfig, context: Optional[Dict[str, Any]] = None) -> Any:
         if value is None:
             return None
 
-        ssn = str(value)
-        digits = re.sub(r'\D', '', ssn)
-        method = config.method
+        return self._dispatch.get(config.method, self._redact)(str(value))
 
-        if method == AnonymizationMethod.REDACT:
-            return "[SSN_REDACTED]"
+    def build_specialized(self, config: FieldConfig) -> SpecializedAnonymizer:
+        if config.method is AnonymizationMethod.MASK:
+            mask_ssn = self._mask
 
-        elif method == AnonymizationMethod.MASK:
-            if len(digits) >= 4:
-                return f"***-**-{digits[-4:]}"
-            return "***-**-****"
+            def mask(value: Any, context: Optional[Dict[str, Any]] = None) -> Any:
+                return None if value is None else mask_ssn(str(value))
 
-        elif method == AnonymizationMethod.HASH:
-            hash_val = hashlib.sha256(ssn.encode()).hexdigest()[:9]
-            return f"{hash_val[:3]}-{hash_val[3:5]}-{hash_val[5:9]}"
-
-        elif method == AnonymizationMethod.FAKE:
-            seed = int(hashlib.md5(ssn.encode()).hexdigest()[:8], 16)
-            random.seed(seed)
-            area = random.randint(100, 999)
-            group = random.randint(10, 99)
-            serial = random.randint(1000, 9999)
-            return f"{area}-{group}-{serial}"
+            return mask
+        return super().build_specialized(config)
 
+    def _redact(self, ssn: str) -> str:
         return "[SSN_REDACTED]"
 
+    def _mask(self, ssn: str) -> str:
+        digits = _NON_DIGIT_RE.sub('', ssn)
+        if len(digits) >= 4:
+            return f"***-**-{digits[-4:]}"
+        return "***-**-****"
+
+    def _hash(self, ssn: str) -> str:
+        hash_val = hashlib.sha256(ssn.encode()).digest()[:5].hex()[:9]
+        return f"{hash_val[:3]}-{hash_val[3:5]}-{hash_val[5:9]}"
+
+    def _fake(self, ssn: str) -> str:
+        h, area = divmod(_det_rand(ssn), 900)
+        h, group = divmod(h, 90)
+        serial = h % 9000
+        return f"{100 + area}-{10 + group}-{1000 + serial}"
+
 
 class DateAnonymizer(Anonymizer):
     """Anonymize dates."""
 
-    def anonymize(self, value: Any, config: FieldConfig, context: Dict[str, Any] = None) -> Any:
+    def __init__(self) -> None:
+        self._dispatch = {
+            AnonymizationMethod.REDACT: self._redact,
+            AnonymizationMethod.GENERALIZE: self._generalize,
+            AnonymizationMethod.FAKE: self._fake,
+        }
+        # GENERALIZE output depends only on the year (and month), so cache it
+        self._year_cache: Dict[int, str] = {}
+        self._month_cache: Dict[Tuple[int, int], str] = {}
+        self._decade_cache: Dict[int, str] = {}
+
+    def anonymize(self, value: Any, config: FieldConfig, context: Optional[Dict[str, Any]] = None) -> Any:
         if value is None:
             return None
 
-        method = config.method
-
         if isinstance(value, (date, datetime)):
             dt = value
         else:
+            text = value if type(value) is str else str(value)
             try:
-                dt = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+                dt = datetime.fromisoformat(text)
             except ValueError:
-                return "[DATE_REDACTED]"
-
-        if method == AnonymizationMethod.REDACT:
-            return "[DATE_REDACTED]"
-
-        elif method == AnonymizationMethod.GENERALIZE:
-            precision = config.params.get("precision", "month")
-            if precision == "year":
-                return dt.strftime("%Y-01-01")
-            elif precision == "month":
-                return dt.strftime("%Y-%m-01")
-            elif precision == "decade":
-                decade = (dt.year // 10) * 10
-                return f"{decade}-01-01"
-
-        elif method == AnonymizationMethod.FAKE:
-            seed = int(hashlib.md5(str(value).encode()).hexdigest()[:8], 16)
-            random.seed(seed)
-            shift_days = random.randint(-365, 365)
-            new_date = dt + timedelta(days=shift_days)
-            return new_date.strftime("%Y-%m-%d")
-
+                # Older Pythons reject a trailing "Z" for UTC
+                if 'Z' not in text:
+                    return "[DATE_REDACTED]"
+                try:
+                    dt = datetime.fromisoformat(text.replace('Z', '+00:00'))
+                except ValueError:
+                    return "[DATE_REDACTED]"
+
+        return self._dispatch.get(config.method, self._default)(dt, value, config)
+
+    def _redact(self, dt: date, value: Any, config: FieldConfig) -> str:
+        return "[DATE_REDACTED]"
+
+    def _generalize(self, dt: date, value: Any, config: FieldConfig) -> str:
+        precision = config.params.get("precision", "month")
+        if precision == "year":
+            label = self._year_cache.get(dt.year)
+            if label is None:
+                label = self._year_cache[dt.year] = f"{dt.year}-01-01"
+            return label
+        elif precision == "month":
+            key = (dt.year, dt.month)
+            label = self._month_cache.get(key)
+            if label is None:
+                label = self._month_cache[key] = f"{dt.year}-{dt.month:02d}-01"
+            return label
+        elif precision == "decade":
+            decade = (dt.year // 10) * 10
+            label = self._decade_cache.get(decade)
+            if label is None:
+                label = self._decade_cache[decade] = f"{decade}-01-01"
+            return label
+        return self._default(dt, value, config)
+
+    def _fake(self, dt: date, value: Any, config: FieldConfig) -> str:
+        shift_days = _det_rand(str(value)) % 731 - 365
+        new_date = dt + timedelta(days=shift_days)
+        return new_date.strftime("%Y-%m-%d")
+
+    def _default(self, dt: date, value: Any, config: FieldConfig) -> str:
         return dt.strftime("%Y-%m-%d")
 
 
 class NumericAnonymizer(Anonymizer):
     """Anonymize numeric values."""
 
-    def anonymize(self, value: Any, config: FieldConfig, context: Dict[str, Any] = None) -> Any:
+    DEFAULT_RANGES = [[0, 10], [11, 20], [21, 50], [51, 100]]
+
+    def __init__(self) -> None:
+        self._dispatch = {
+            AnonymizationMethod.REDACT: self._redact,
+            AnonymizationMethod.GENERALIZE: self._generalize,
+            AnonymizationMethod.FAKE: self._fake,
+        }
+
+    @staticmethod
+    def _buckets(config: FieldConfig) -> List[Tuple[Any, Any, str]]:
+        """Build (low, high, label) triples for GENERALIZE."""
+        ranges = config.params.get("ranges", NumericAnonymizer.DEFAULT_RANGES)
+        return [(r[0], r[1], f"{r[0]}-{r[1]}") for r in ranges]
+
+    def anonymize_column(
+        self,
+        values: List[Any],
+        config: FieldConfig,
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        if config.method != AnonymizationMethod.GENERALIZE:
+            return super().anonymize_column(values, config, context)
+
+        # Build the bucket labels once for the whole column
+        buckets = self._buckets(config)
+        result: List[Any] = []
+        for value in values:
+            if value is None:
+                result.append(None)
+                continue
+            try:
+                num = float(value)
+            except (ValueError, TypeError):
+                result.append(None)
+                continue
+            for low, high, label in buckets:
+                if low <= num <= high:
+                    result.append(label)
+                    break
+            else:
+                result.append("other")
+        return result
+
+    def anonymize(self, value: Any, config: FieldConfig, context: Optional[Dict[str, Any]] = None) -> Any:
         if value is None:
             return None
 
@@ -402,117 +616,165 @@ class NumericAnonymizer(Anonymizer):
         except (ValueError, TypeError):
             return None
 
-        method = config.method
-
-        if method == AnonymizationMethod.REDACT:
-            return 0
+        handler = self._dispatch.get(config.method)
+        if handler is None:
+            return num
+        return handler(num, value, config)
 
-        elif method == AnonymizationMethod.GENERALIZE:
-            ranges = config.params.get("ranges", [[0, 10], [11, 20], [21, 50], [51, 100]])
-            for r in ranges:
-                if r[0] <= num <= r[1]:
-                    return f"{r[0]}-{r[1]}"
-            return "other"
+    def _redact(self, num: float, value: Any, config: FieldConfig) -> int:
+        return 0
 
-        elif method == AnonymizationMethod.FAKE:
-            seed = int(hashlib.md5(str(value).encode()).hexdigest()[:8], 16)
-            random.seed(seed)
-            noise_pct = config.params.get("noise_percent", 10)
-            noise = num * (random.uniform(-noise_pct, noise_pct) / 100)
-            return round(num + noise, 2)
+    def _generalize(self, num: float, value: Any, config: FieldConfig) -> str:
+        # Single values only format the label that matches
+        for r in config.params.get("ranges", self.DEFAULT_RANGES):
+            if r[0] <= num <= r[1]:
+                return f"{r[0]}-{r[1]}"
+        return "other"
 
-        return num
+    def _fake(self, num: float, value: Any, config: FieldConfig) -> float:
+        noise_pct: float = config.params.get("noise_percent", 10)
+        # Top 53 bits of the hash as a uniform float in [0, 1)
+        unit = (_det_rand(str(value)) >> 11) / (1 << 53)
+        noise = num * ((unit * 2 - 1) * noise_pct / 100)
+        return round(num + noise, 2)
 
 
 class TextAnonymizer(Anonymizer):
     """Anonymize free text fields."""
 
-    def anonymize(self, value: Any, config: FieldConfig, context: Dict[str, Any] = None) -> Any:
+    def __init__(self) -> None:
+        self._dispatch = {
+            AnonymizationMethod.REDACT: self._redact,
+            AnonymizationMethod.HASH: self._hash,
+            AnonymizationMethod.MASK: self._mask,
+            AnonymizationMethod.PRESERVE: self._preserve,
+        }
+
+    def anonymize(self, value: Any, config: FieldConfig, context: Optional[Dict[str, Any]] = None) -> Any:
         if value is None:
             return None
 
-        text = str(value)
-        method = config.method
+        return self._dispatch.get(config.method, self._redact)(str(value))
 
-        if method == AnonymizationMethod.REDACT:
-            return "[TEXT_REDACTED]"
+    def build_specialized(self, config: FieldConfig) -> SpecializedAnonymizer:
+        if config.method is AnonymizationMethod.MASK:
+            def mask(value: Any, context: Optional[Dict[str, Any]] = None) -> Any:
+                return None if value is None else str(value).translate(_ALNUM_MASK_TABLE)
 
-        elif method == AnonymizationMethod.HASH:
-            hash_val = hashlib.sha256(text.encode()).hexdigest()[:16]
-            return f"text_{hash_val}"
+            return mask
+        return super().build_specialized(config)
 
-        elif method == AnonymizationMethod.MASK:
-            return re.sub(r'[a-zA-Z0-9]', '*', text)
+    def _redact(self, text: str) -> str:
+        return "[TEXT_REDACTED]"
 
-        elif method == AnonymizationMethod.PRESERVE:
-            return text
+    def _hash(self, text: str) -> str:
+        hash_val = hashlib.sha256(text.encode()).digest()[:8].hex()
+        return f"text_{hash_val}"
 
-        return "[TEXT_REDACTED]"
+    def _mask(self, text: str) -> str:
+        return text.translate(_ALNUM_MASK_TABLE)
+
+    def _preserve(self, text: str) -> str:
+        return text
 
 
 class AddressAnonymizer(Anonymizer):
     """Anonymize addresses."""
 
-    FAKE_STREETS = ["Main St", "Oak Ave", "Park Blvd", "First St", "Elm Way", "Maple Dr"]
-    FAKE_CITIES = ["Springfield", "Riverside", "Fairview", "Madison", "Georgetown", "Clinton"]
+    FAKE_STREETS = ("Main St", "Oak Ave", "Park Blvd", "First St", "Elm Way", "Maple Dr")
+    FAKE_CITIES = ("Springfield", "Riverside", "Fairview", "Madison", "Georgetown", "Clinton")
+    FAKE_STATES = ("CA", "NY", "TX", "FL", "WA", "IL")
+
+    def __init__(self) -> None:
+        self._dispatch = {
+            AnonymizationMethod.REDACT: self._redact,
+            AnonymizationMethod.FAKE: self._fake,
+            AnonymizationMethod.GENERALIZE: self._generalize,
+        }
 
-    def anonymize(self, value: Any, config: FieldConfig, context: Dict[str, Any] = None) -> Any:
+    def anonymize(self, value: Any, config: FieldConfig, context: Optional[Dict[str, Any]] = None) -> Any:
         if value is None:
             return None
 
-        address = str(value)
-        method = config.method
-
-        if method == AnonymizationMethod.REDACT:
-            return "[ADDRESS_REDACTED]"
-
-        elif method == AnonymizationMethod.FAKE:
-            seed = int(hashlib.md5(address.encode()).hexdigest()[:8], 16)
-            random.seed(seed)
-            num = random.randint(100, 9999)
-            street = random.choice(self.FAKE_STREETS)
-            city = random.choice(self.FAKE_CITIES)
-            state = random.choice(["CA", "NY", "TX", "FL", "WA", "IL"])
-            zipcode = random.randint(10000, 99999)
-            return f"{num} {street}, {city}, {state} {zipcode}"
-
-        elif method == AnonymizationMethod.GENERALIZE:
-            precision = config.params.get("precision", "city")
-            if precision == "zip":
-                zip_match = re.search(r'\b\d{5}(?:-\d{4})?\b', address)
-                if zip_match:
-                    return zip_match.group()
-            return "[LOCATION_GENERALIZED]"
+        return self._dispatch.get(config.method, self._redact)(str(value), config)
 
+    def _redact(self, address: str, config: FieldConfig) -> str:
         return "[ADDRESS_REDACTED]"
 
+    def _fake(self, address: str, config: FieldConfig) -> str:
+        h, num = divmod(_det_rand(address), 9900)
+        h, street = divmod(h, len(self.FAKE_STREETS))
+        h, city = divmod(h, len(self.FAKE_CITIES))
+        h, state = divmod(h, len(self.FAKE_STATES))
+        zipcode = h % 90000
+        return (
+            f"{100 + num} {self.FAKE_STREETS[street]}, {self.FAKE_CITIES[city]}, "
+            f"{self.FAKE_STATES[state]} {10000 + zipcode}"
+        )
+
+    def _generalize(self, address: str, config: FieldConfig) -> str:
+        precision = config.params.get("precision", "city")
+        if precision == "zip":
+            zip_match = _ZIP_RE.search(address)
+            if zip_match:
+                return zip_match.group()
+        return "[LOCATION_GENERALIZED]"
+
 
 class CreditCardAnonymizer(Anonymizer):
     """Anonymize credit card numbers."""
 
-    def anonymize(self, value: Any, config: FieldConfig, context: Dict[str, Any] = None) -> Any:
+    def __init__(self) -> None:
+        self._dispatch = {
+            AnonymizationMethod.REDACT: self._redact,
+            AnonymizationMethod.MASK: self._mask,
+            AnonymizationMethod.HASH: self._hash,
+        }
+
+    def anonymize(self, value: Any, config: FieldConfig, context: Optional[Dict[str, Any]] = None) -> Any:
         if value is None:
             return None
 
-        cc = str(value)
-        digits = re.sub(r'\D', '', cc)
-        method = config.method
+        return self._dispatch.get(config.method, self._redact)(str(value), config)
 
-        if method == AnonymizationMethod.REDACT:
-            return "[CC_REDACTED]"
+    def build_specialized(self, config: FieldConfig) -> SpecializedAnonymizer:
+        if config.method is AnonymizationMethod.MASK:
+            return _specialize_digit_mask(config)
+        return super().build_specialized(config)
 
-        elif method == AnonymizationMethod.MASK:
-            show_last = config.params.get("show_last", 4)
-            mask_char = config.params.get("mask_char", "*")
-            if len(digits) > show_last:
-                return mask_char * (len(digits) - show_last) + digits[-show_last:]
-            return mask_char * len(digits)
+    def _redact(self, cc: str, config: FieldConfig) -> str:
+        return "[CC_REDACTED]"
 
-        elif method == AnonymizationMethod.HASH:
-            hash_val = hashlib.sha256(cc.encode()).hexdigest()[:16]
-            return hash_val
+    def _mask(self, cc: str, config: FieldConfig) -> str:
+        return _mask_digits(cc, config.params.get("show_last", 4), config.params.get("mask_char", "*"))
 
-        return "[CC_REDACTED]"
+    def _hash(self, cc: str, config: FieldConfig) -> str:
+        return hashlib.sha256(cc.encode()).digest()[:8].hex()
+
+
+class _FieldPlan:
+    """
+    Per-field state prebuilt by DataAnonymizer: config and consistency cache.
+
+    The anonymizer itself is looked up in DataAnonymizer.anonymizers on
+    every use, so replacing a registry entry takes effect immediately; the
+    function specialized for it is rebuilt only when that lookup changes.
+    """
+
+    __slots__ = ("config", "cache", "_bound")
+
+    def __init__(self, config: FieldConfig, cache: Dict[Any, Any]) -> None:
+        self.config = config
+        self.cache = cache
+        self._bound: Optional[Tuple[Anonymizer, SpecializedAnonymizer]] = None
+
+    def specialized(self, anonymizer: Anonymizer) -> SpecializedAnonymizer:
+        """Return anonymizer's single-value function for this field's config."""
+        bound = self._bound
+        if bound is None or bound[0] is not anonymizer:
+            # One tuple assignment, so concurrent callers never see a mismatch
+            bound = self._bound = (anonymizer, anonymizer.build_specialized(self.config))
+        return bound[1]
 
 
 class DataAnonymizer:
@@ -566,7 +828,23 @@ class DataAnonymizer:
             }
 
         # Track anonymized values for consistency
-        self._consistency_map: Dict[str, Dict[str, Any]] = {}
+        self._consistency_map: Dict[Tuple[str, str], Dict[Any, Any]] = {}
+        self._context: Dict[str, Any] = {"vault": self.vault} if self.vault else {}
+
+        # Per-table plan: field name -> config and consistency cache
+        self._field_plan: Dict[str, Dict[str, _FieldPlan]] = {
+            table_name: {
+                field_name: _FieldPlan(
+                    field_config, self._consistency_map.setdefault((table_name, field_name), {})
+                )
+                for field_name, field_config in fields.items()
+            }
+            for table_name, fields in self.field_configs.items()
+        }
+
+    def _anonymizer_for(self, config: FieldConfig) -> Anonymizer:
+        """Look up the registered anonymizer for a field, defaulting to text."""
+        return self.anonymizers.get(config.field_type) or self.anonymizers["text"]
 
     def anonymize_record(
         self,
@@ -577,31 +855,28 @@ class DataAnonymizer:
         if table_name not in self.field_configs:
             return record
 
-        result = {}
-        field_configs = self.field_configs[table_name]
+        result: Dict[str, Any] = {}
+        field_plan = self._field_plan[table_name]
+        preserve_nulls = self.config.preserve_nulls
 
         for field_name, value in record.items():
-            if field_name in field_configs:
-                config = field_configs[field_name]
+            plan = field_plan.get(field_name)
+            if plan is not None:
+                cache = plan.cache
 
-                if value is None and self.config.preserve_nulls:
+                if value is None and preserve_nulls:
                     result[field_name] = None
                     continue
 
-                consistency_key = f"{table_name}.{field_name}"
-                if value is not None and consistency_key in self._consistency_map:
-                    if str(value) in self._consistency_map[consistency_key]:
-                        result[field_name] = self._consistency_map[consistency_key][str(value)]
-                        continue
-
-                anonymizer = self.anonymizers.get(config.field_type, self.anonymizers["text"])
-                context = {"vault": self.vault} if self.vault else {}
-
-                anon_value = anonymizer.anonymize(value, config, context)
+                key = _cache_key(value)
+                cached = cache.get(key, _MISSING)
+                if cached is not _MISSING:
+                    result[field_name] = cached
+                    continue
 
-                if consistency_key not in self._consistency_map:
-                    self._consistency_map[consistency_key] = {}
-                self._consistency_map[consistency_key][str(value)] = anon_value
+                anonymize = plan.specialized(self._anonymizer_for(plan.config))
+                anon_value = anonymize(value, self._context)
+                cache[key] = anon_value
 
                 result[field_name] = anon_value
             else:
@@ -609,30 +884,151 @@ class DataAnonymizer:
 
         return result
 
+    def anonymize_record_inplace(
+        self,
+        record: Dict[str, Any],
+        table_name: str
+    ) -> Dict[str, Any]:
+        """
+        Anonymize a single record by overwriting its configured fields.
+
+        Same results as anonymize_record(), but no new dict is built and
+        unconfigured fields are never visited. Use it when the caller owns
+        the record (e.g. rows fresh from a DB cursor). If an anonymizer
+        raises, fields processed before it have already been overwritten.
+
+        Returns:
+            The same record object
+        """
+        field_plan = self._field_plan.get(table_name)
+        if field_plan is None:
+            return record
+
+        preserve_nulls = self.config.preserve_nulls
+
+        for field_name, plan in field_plan.items():
+            if field_name not in record:
+                continue
+
+            value = record[field_name]
+            if value is None and preserve_nulls:
+                continue
+
+            cache = plan.cache
+            key = _cache_key(value)
+            cached = cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                record[field_name] = cached
+                continue
+
+            anonymize = plan.specialized(self._anonymizer_for(plan.config))
+            anon_value = anonymize(value, self._context)
+            cache[key] = anon_value
+            record[field_name] = anon_value
+
+        return record
+
     def anonymize_records(
         self,
         records: List[Dict[str, Any]],
         table_name: str
     ) -> Tuple[List[Dict[str, Any]], AnonymizationResult]:
-        """Anonymize a list of records."""
+        """
+        Anonymize a list of records.
+
+        Works column by column: each configured field is gathered across all
+        records, deduplicated against the consistency map, and handed to its
+        anonymizer in a single anonymize_column() call.
+        """
         import time
         start = time.time()
 
-        anonymized = []
-        fields_processed: Dict[str, int] = {}
-        errors = []
+        anonymized, fields_processed, failed = self._anonymize_rows(records, table_name)
 
-        for i, record in enumerate(records):
-            try:
-                anon_record = self.anonymize_record(record, table_name)
-                anonymized.append(anon_record)
+        result = AnonymizationResult(
+            original_count=len(records),
+            anonymized_count=len(anonymized),
+            fields_processed=fields_processed,
+            processing_time_seconds=time.time() - start,
+            errors=[f"Record {i}: {failed[i]}" for i in sorted(failed)],
+        )
 
-                for field in anon_record.keys():
-                    fields_processed[field] = fields_processed.get(field, 0) + 1
+        return anonymized, result
 
-            except Exception as e:
-                errors.append(f"Record {i}: {str(e)}")
-                anonymized.append(record)
+    def anonymize_records_parallel(
+        self,
+        records: List[Dict[str, Any]],
+        table_name: str,
+        workers: Optional[int] = None,
+        chunk_size: int = 10_000
+    ) -> Tuple[List[Dict[str, Any]], AnonymizationResult]:
+        """
+        Anonymize a large list of records across worker processes.
+
+        Records are split into chunks of chunk_size and each chunk is
+        anonymized in a worker process by a DataAnonymizer built from the
+        same config and a copy of self.anonymizers, starting from this
+        instance's consistency map. Since workers use the same anonymizers,
+        the entries they add are merged back into the consistency map.
+
+        Falls back to anonymize_records() when the token vault is enabled
+        (tokens must come from a single vault), when there is only one
+        chunk, or when self.anonymizers cannot be pickled for the workers.
+
+        Args:
+            records: Records to anonymize
+            table_name: Table the records belong to
+            workers: Number of worker processes (default: CPU count)
+            chunk_size: Number of records per worker task
+
+        Returns:
+            Tuple of anonymized records and an AnonymizationResult
+        """
+        if (
+            self.vault is not None
+            or table_name not in self.field_configs
+            or len(records) <= chunk_size
+            or workers == 1
+        ):
+            return self.anonymize_records(records, table_name)
+
+        import pickle
+        try:
+            anonymizers = pickle.dumps(self.anonymizers)
+        except Exception:
+            # e.g. a replacement anonymizer defined inside a function
+            return self.anonymize_records(records, table_name)
+
+        import time
+        from concurrent.futures import ProcessPoolExecutor
+        start = time.time()
+
+        caches = {
+            field_name: plan.cache for field_name, plan in self._field_plan[table_name].items()
+        }
+        chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+
+        anonymized: List[Dict[str, Any]] = []
+        fields_processed: Dict[str, int] = {}
+        errors: List[str] = []
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.config, anonymizers, table_name, caches),
+        ) as executor:
+            for n, (chunk_anonymized, chunk_fields, chunk_failed, chunk_caches) in enumerate(
+                executor.map(_anonymize_chunk, chunks)
+            ):
+                offset = n * chunk_size
+                anonymized.extend(chunk_anonymized)
+                for field_name, count in chunk_fields.items():
+                    fields_processed[field_name] = fields_processed.get(field_name, 0) + count
+                errors.extend(
+                    f"Record {offset + i}: {chunk_failed[i]}" for i in sorted(chunk_failed)
+                )
+                for field_name, chunk_cache in chunk_caches.items():
+                    caches[field_name].update(chunk_cache)
 
         result = AnonymizationResult(
             original_count=len(records),
@@ -644,6 +1040,135 @@ class DataAnonymizer:
 
         return anonymized, result
 
+    def _anonymize_rows(
+        self,
+        records: List[Dict[str, Any]],
+        table_name: str
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int], Dict[int, str]]:
+        """
+        Anonymize records column by column.
+
+        Returns the anonymized records, per-field counts, and the error
+        message for each record index that failed.
+        """
+        failed: Dict[int, str] = {}
+
+        if table_name not in self.field_configs:
+            fields_processed: "Counter[str]" = Counter()
+            for i, record in enumerate(records):
+                try:
+                    fields_processed.update(record.keys())
+                except Exception as e:
+                    failed[i] = str(e)
+            return list(records), dict(fields_processed), failed
+
+        # Shallow copies that the columns are written into; failed rows get
+        # an empty placeholder and are returned as given
+        copies: List[Dict[str, Any]] = []
+        for i, record in enumerate(records):
+            try:
+                copies.append(record.copy() if type(record) is dict else dict(record.items()))
+            except Exception as e:
+                failed[i] = str(e)
+                copies.append({})
+
+        for field_name, plan in self._field_plan[table_name].items():
+            rows = [
+                i for i, copy in enumerate(copies)
+                if i not in failed and field_name in copy
+            ]
+            if rows:
+                config = plan.config
+                self._anonymize_column(
+                    copies, rows, field_name, config, self._anonymizer_for(config), plan.cache, failed
+                )
+
+        if failed:
+            anonymized = [
+                records[i] if i in failed else copy for i, copy in enumerate(copies)
+            ]
+            succeeded = [copy for i, copy in enumerate(copies) if i not in failed]
+        else:
+            anonymized = succeeded = copies
+
+        fields_processed = Counter(chain.from_iterable(copy.keys() for copy in succeeded))
+        return anonymized, dict(fields_processed), failed
+
+    def _anonymize_column(
+        self,
+        copies: List[Dict[str, Any]],
+        rows: List[int],
+        field_name: str,
+        config: FieldConfig,
+        anonymizer: Anonymizer,
+        cache: Dict[Any, Any],
+        failed: Dict[int, str],
+    ) -> None:
+        """
+        Anonymize one field across the given rows.
+
+        Overwrites the field in each row's copy with its anonymized value.
+        Rows whose value could not be anonymized are recorded in failed.
+        """
+        preserve_nulls = self.config.preserve_nulls
+
+        pending: List[Any] = []  # distinct values still to anonymize
+        slots: Dict[Any, int] = {}  # cache key -> index into pending
+        pending_rows: List[Tuple[int, int]] = []  # (row, index into pending)
+
+        for i in rows:
+            value = copies[i][field_name]
+            if value is None and preserve_nulls:
+                continue
+
+            # _cache_key(), inlined for the common types
+            value_type = type(value)
+            if value_type is str:
+                key = value
+            elif value_type in _SELF_KEYED_TYPES:
+                key = (value_type, value)
+            else:
+                try:
+                    key = (value_type, str(value))
+                except Exception as e:
+                    failed[i] = str(e)
+                    continue
+            cached = cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                copies[i][field_name] = cached
+            elif key in slots:
+                pending_rows.append((i, slots[key]))
+            else:
+                slots[key] = len(pending)
+                pending_rows.append((i, len(pending)))
+                pending.append(value)
+
+        if not pending:
+            return
+
+        errors: Dict[int, str] = {}
+        try:
+            results = anonymizer.anonymize_column(pending, config, self._context)
+        except Exception:
+            # Fall back to one value at a time to find which ones fail
+            results = []
+            for j, value in enumerate(pending):
+                try:
+                    results.append(anonymizer.anonymize(value, config, self._context))
+                except Exception as e:
+                    errors[j] = str(e)
+                    results.append(None)
+
+        for key, j in slots.items():
+            if j not in errors:
+                cache[key] = results[j]
+
+        for i, j in pending_rows:
+            if j in errors:
+                failed[i] = errors[j]
+            else:
+                copies[i][field_name] = results[j]
+
     def anonymize_text(self, text: str, method: AnonymizationMethod = AnonymizationMethod.REDACT) -> str:
         """
         Simple text anonymization.
@@ -669,6 +1194,48 @@ class DataAnonymizer:
         return None
 
 
+# Per-process state for anonymize_records_parallel workers
+_worker_anonymizer: Optional[DataAnonymizer] = None
+_worker_table: str = ""
+
+
+def _init_worker(
+    config: AnonymizationConfig,
+    anonymizers: bytes,
+    table_name: str,
+    caches: Dict[str, Dict[Any, Any]]
+) -> None:
+    """Build the worker's DataAnonymizer with the parent's anonymizers and consistency map."""
+    import pickle
+    global _worker_anonymizer, _worker_table
+    anonymizer = DataAnonymizer(config)
+    anonymizer.anonymizers = pickle.loads(anonymizers)
+    for field_name, plan in anonymizer._field_plan[table_name].items():
+        plan.cache.update(caches.get(field_name, {}))
+    _worker_anonymizer = anonymizer
+    _worker_table = table_name
+
+
+def _anonymize_chunk(
+    records: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], Dict[str, int], Dict[int, str], Dict[str, Dict[Any, Any]]]:
+    """Anonymize one chunk in a worker and return its results and new cache entries."""
+    anonymizer = _worker_anonymizer
+    if anonymizer is None:
+        raise RuntimeError("_anonymize_chunk() called outside an initialized worker")
+    field_plan = anonymizer._field_plan[_worker_table]
+    sizes = {field_name: len(plan.cache) for field_name, plan in field_plan.items()}
+
+    anonymized, fields_processed, failed = anonymizer._anonymize_rows(records, _worker_table)
+
+    # Only ship back what this chunk added; dicts keep insertion order
+    new_entries = {
+        field_name: dict(islice(plan.cache.items(), sizes[field_name], None))
+        for field_name, plan in field_plan.items()
+    }
+    return anonymized, fields_processed, failed, new_entries
+
+
 class AnonymizationTemplates:
     """Common anonymization configurations."""
 
@@ -32,36 +32,30 @@ Examples:
     ]
 """
 
-import argparse
 import sys
-import json
-from typing import Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
+if TYPE_CHECKING:
+    import argparse
 
-def main(args: Optional[list] = None) -> int:
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        prog="pii-guard",
-        description="Fast, accurate PII detection for LLM applications",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  pii-guard scan "Contact john@example.com"
-  pii-guard scan "Text" --json
-  pii-guard redact "SSN: 123-45-6789"
-  pii-guard entities
-        """
-    )
 
-    parser.add_argument(
-        "--version", "-v",
-        action="store_true",
-        help="Show version and exit"
-    )
+# Entity types grouped for `pii-guard entities`
+_CATEGORIES = {
+    "Financial": ("SSN", "CREDIT_CARD", "IBAN", "BITCOIN_ADDRESS", "ETHEREUM_ADDRESS",
+                  "ROUTING_NUMBER", "BANK_ACCOUNT", "SWIFT_CODE"),
+    "Contact": ("EMAIL", "PHONE", "IP_ADDRESS", "IPV6_ADDRESS", "MAC_ADDRESS"),
+    "Personal": ("NAME", "ADDRESS", "DATE_OF_BIRTH", "DRIVER_LICENSE", "PASSPORT"),
+    "Vehicle": ("VIN", "LICENSE_PLATE"),
+    "Healthcare": ("MEDICAL_RECORD", "MEDICARE", "DEA_NUMBER", "NPI"),
+    "International IDs": ("UK_NINO", "CANADA_SIN", "FRANCE_INSEE", "GERMANY_STEUER",
+                          "INDIA_AADHAAR", "INDIA_PAN"),
+    "Corporate": ("EMPLOYEE_ID", "TAX_ID"),
+}
+_ENTITY_TO_CATEGORY = {t: category for category, types in _CATEGORIES.items() for t in types}
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # scan command
+def _add_scan_parser(subparsers: "argparse._SubParsersAction[argparse.ArgumentParser]") -> None:
     scan_parser = subparsers.add_parser(
         "scan",
         help="Detect PII in text",
@@ -83,7 +77,8 @@ Examples:
         help="Minimum confidence threshold (0.0-1.0)"
     )
 
-    # redact command
+
+def _add_redact_parser(subparsers: "argparse._SubParsersAction[argparse.ArgumentParser]") -> None:
     redact_parser = subparsers.add_parser(
         "redact",
         help="Redact PII from text",
@@ -99,7 +94,8 @@ Examples:
         help="Mask character (default: *)"
     )
 
-    # entities command
+
+def _add_entities_parser(subparsers: "argparse._SubParsersAction[argparse.ArgumentParser]") -> None:
     entities_parser = subparsers.add_parser(
         "entities",
         help="List all supported PII entity types",
@@ -111,8 +107,189 @@ Examples:
         help="Output as JSON"
     )
 
-    # Parse args
-    parsed = parser.parse_args(args)
+
+_SUBCOMMANDS = {
+    "scan": _add_scan_parser,
+    "redact": _add_redact_parser,
+    "entities": _add_entities_parser,
+}
+
+
+def _sniff_subcommand(argv: list) -> Optional[str]:
+    """Return the subcommand named in argv, if any.
+
+    Only root options (--version, --help) can precede the subcommand, so
+    the first positional token is the command name.
+    """
+    for token in argv:
+        if not token.startswith("-"):
+            return token if token in _SUBCOMMANDS else None
+    return None
+
+
+# Exact flag spellings the fast path understands, per command:
+# flag -> (namespace attribute, takes_value)
+_FAST_FLAGS = {
+    "scan": {
+        "--json": ("json", False), "-j": ("json", False),
+        "--min-confidence": ("min_confidence", True), "-c": ("min_confidence", True),
+    },
+    "redact": {
+        "--mask": ("mask", True), "-m": ("mask", True),
+    },
+    "entities": {
+        "--json": ("json", False), "-j": ("json", False),
+    },
+}
+
+_FAST_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "scan": {"json": False, "min_confidence": 0.0},
+    "redact": {"mask": "*"},
+    "entities": {"json": False},
+}
+
+
+def _fast_parse(argv: list) -> Optional[SimpleNamespace]:
+    """Parse the common invocations without argparse.
+
+    Handles ``<command> [text] [flags]`` using only the exact flag
+    spellings in ``_FAST_FLAGS``. Anything else (help, abbreviations,
+    ``--flag=value``, ``--``, bad values, unknown tokens) returns None so
+    argparse produces its usual behavior and error messages.
+    """
+    if not argv or argv[0] not in _FAST_FLAGS:
+        return None
+    command = argv[0]
+    flags = _FAST_FLAGS[command]
+    values: Dict[str, Any] = dict(_FAST_DEFAULTS[command])
+    text = None
+
+    tokens = iter(argv[1:])
+    for token in tokens:
+        if token.startswith("-"):
+            spec = flags.get(token)
+            if spec is None:
+                return None
+            attr, takes_value = spec
+            if not takes_value:
+                values[attr] = True
+                continue
+            value = next(tokens, None)
+            if value is None or value.startswith("-"):
+                return None
+            if attr == "min_confidence":
+                try:
+                    value = float(value)
+                except ValueError:
+                    return None
+            values[attr] = value
+        elif text is None and command != "entities":
+            text = token
+        else:
+            return None
+
+    if command != "entities":
+        if text is None:
+            return None
+        values["text"] = text
+    return SimpleNamespace(version=False, command=command, **values)
+
+
+_EPILOG = """
+Examples:
+  pii-guard scan "Contact john@example.com"
+  pii-guard scan "Text" --json
+  pii-guard redact "SSN: 123-45-6789"
+  pii-guard entities
+        """
+
+
+def _may_request_help(argv: list) -> bool:
+    """Return True if argv could ask argparse for the root help text.
+
+    Errs on the side of True: any ``--h...`` prefix or short-flag
+    cluster containing ``h`` counts.
+    """
+    for token in argv:
+        if token.startswith("--h"):
+            return True
+        if token.startswith("-") and not token.startswith("--") and "h" in token:
+            return True
+    return False
+
+
+def _build_parser(
+    command: Optional[str] = None,
+    full_help: bool = True,
+) -> "argparse.ArgumentParser":
+    """Build the CLI parser.
+
+    With a known command only that subparser is added; otherwise all of
+    them are, so help and error messages list every command. The examples
+    epilog and its formatter are only set up when ``full_help`` is True,
+    since only the root help text shows them.
+    """
+    import argparse
+
+    kwargs: Dict[str, Any] = {
+        "prog": "pii-guard",
+        "description": "Fast, accurate PII detection for LLM applications",
+    }
+    if full_help:
+        kwargs["formatter_class"] = argparse.RawDescriptionHelpFormatter
+        kwargs["epilog"] = _EPILOG
+    parser = argparse.ArgumentParser(**kwargs)
+
+    parser.add_argument(
+        "--version", "-v",
+        action="store_true",
+        help="Show version and exit"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    if command is not None:
+        _SUBCOMMANDS[command](subparsers)
+    else:
+        for add_parser in _SUBCOMMANDS.values():
+            add_parser(subparsers)
+
+    return parser
+
+
+# Parsers built so far, keyed by (command, full_help)
+_PARSERS: Dict[Tuple[Optional[str], bool], "argparse.ArgumentParser"] = {}
+
+
+def _get_parser(
+    command: Optional[str] = None,
+    full_help: bool = True,
+) -> "argparse.ArgumentParser":
+    """Return the parser for ``command``, building it on first use."""
+    key = (command, full_help)
+    parser = _PARSERS.get(key)
+    if parser is None:
+        parser = _PARSERS[key] = _build_parser(command, full_help)
+    return parser
+
+
+def main(args: Optional[list] = None) -> int:
+    """Main CLI entry point."""
+    argv = sys.argv[1:] if args is None else args
+
+    # Answer a bare --version before building any parsers
+    if len(argv) == 1 and argv[0] in ("--version", "-v"):
+        from . import __version__
+        print(f"pii-guard {__version__}")
+        return 0
+
+    # Common invocations skip argparse; help and errors still go through it
+    parsed: Union["argparse.Namespace", SimpleNamespace, None] = _fast_parse(argv)
+    if parsed is None:
+        # Without a command main() prints the root help, so keep the epilog
+        command = _sniff_subcommand(argv)
+        parser = _get_parser(command, command is None or _may_request_help(argv))
+        parsed = parser.parse_args(argv)
 
     # Handle version
     if parsed.version:
@@ -120,20 +297,20 @@ Examples:
         print(f"pii-guard {__version__}")
         return 0
 
-    # Handle no command
+    # Handle no command; the fast path always has one, so this is argparse's root parser
     if not parsed.command:
-        parser.print_help()
+        _get_parser().print_help()
         return 1
 
-    # Import here to avoid slow startup for --help
-    from . import scan, redact, list_entities
-
+    # Import per command to avoid slow startup for --help and entities
     if parsed.command == "scan":
+        from . import scan
         results = scan(parsed.text)
 
         # Filter by confidence
-        if parsed.min_confidence > 0:
-            results = [e for e in results if e.confidence >= parsed.min_confidence]
+        min_confidence = parsed.min_confidence
+        if min_confidence > 0:
+            results = [e for e in results if e.confidence >= min_confidence]
 
         if parsed.json:
             output = [
@@ -146,55 +323,41 @@ Examples:
                 }
                 for e in results
             ]
+            import json
             print(json.dumps(output, indent=2))
         else:
-            if not results:
+            lines = [f"[{e.label}] {e.text} (confidence: {e.confidence:.2f})" for e in results]
+            if not lines:
                 print("No PII detected.")
             else:
-                for e in results:
-                    print(f"[{e.label}] {e.text} (confidence: {e.confidence:.2f})")
+                sys.stdout.write("\n".join(lines) + "\n")
         return 0
 
     elif parsed.command == "redact":
+        from . import redact
         result = redact(parsed.text, parsed.mask)
         print(result)
         return 0
 
     elif parsed.command == "entities":
+        from . import list_entities
         entities = list_entities()
         if parsed.json:
+            import json
             print(json.dumps(entities, indent=2))
         else:
-            print(f"Supported PII entity types ({len(entities)} total):\n")
-            # Group by category
-            categories = {
-                "Financial": ["SSN", "CREDIT_CARD", "IBAN", "BITCOIN_ADDRESS", "ETHEREUM_ADDRESS",
-                             "ROUTING_NUMBER", "BANK_ACCOUNT", "SWIFT_CODE"],
-                "Contact": ["EMAIL", "PHONE", "IP_ADDRESS", "IPV6_ADDRESS", "MAC_ADDRESS"],
-                "Personal": ["NAME", "ADDRESS", "DATE_OF_BIRTH", "DRIVER_LICENSE", "PASSPORT"],
-                "Vehicle": ["VIN", "LICENSE_PLATE"],
-                "Healthcare": ["MEDICAL_RECORD", "MEDICARE", "DEA_NUMBER", "NPI"],
-                "International IDs": ["UK_NINO", "CANADA_SIN", "FRANCE_INSEE", "GERMANY_STEUER",
-                                     "INDIA_AADHAAR", "INDIA_PAN"],
-                "Corporate": ["EMPLOYEE_ID", "TAX_ID"],
-            }
-
-            for category, types in categories.items():
-                matching = [t for t in types if t in entities]
-                if matching:
-                    print(f"  {category}:")
-                    for t in matching:
-                        print(f"    - {t}")
-
-            # Any uncategorized
-            categorized = set()
-            for types in categories.values():
-                categorized.update(types)
-            uncategorized = [t for t in entities if t not in categorized]
-            if uncategorized:
-                print(f"  Other:")
-                for t in uncategorized:
-                    print(f"    - {t}")
+            lines = [f"Supported PII entity types ({len(entities)} total):", ""]
+            # Group by category in one pass; categories print in table order, "Other" last
+            grouped: Dict[str, List[str]] = {category: [] for category in _CATEGORIES}
+            grouped["Other"] = []
+            for t in entities:
+                grouped[_ENTITY_TO_CATEGORY.get(t, "Other")].append(t)
+
+            for category, types in grouped.items():
+                if types:
+                    lines.append(f"  {category}:")
+                    lines.extend(f"    - {t}" for t in types)
+            sys.stdout.write("\n".join(lines) + "\n")
         return 0
 
     return 1
@@ -12,13 +12,210 @@ Features:
 
 import re
 import logging
-import statistics
-from typing import List, Dict, Tuple, Any
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Tuple, Any, ClassVar, Optional
 
 from .entities import PIIEntity
 
 logger = logging.getLogger(__name__)
 
+# Sort/max keys for entities, shared instead of building a lambda per call
+_by_start = attrgetter("start")
+_by_confidence = attrgetter("confidence")
+
+# Every built-in pattern needs at least one of these characters to match: an
+# ASCII letter, a digit or "@". The extra code points are the non-ASCII
+# letters that IGNORECASE folds onto ASCII ones (İ, ı, ſ and the Kelvin sign).
+_CANDIDATE_CHARS = re.compile(r"[A-Za-z@\u0130\u0131\u017f\u212a]|\d")
+_ANY_DIGIT = re.compile(r"\d")
+
+
+# Linear-time gates for address patterns that backtrack quadratically. The
+# "City, ST 12345" pattern retries every word of a long run of words before
+# failing at its end; every match contains its tail, so text without the tail
+# cannot match and the full pattern is skipped.
+_ADDRESS_GATES = {
+    r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?\b": re.compile(
+        r",\s*[A-Z]{2}\s+\d{5}", re.IGNORECASE
+    ),
+}
+
+
+# Script checks for _detect_language, in priority order. _ANY_LANGUAGE_CHAR is
+# their union: one scan decides whether any of them can match at all.
+_LANGUAGE_CHARS = (
+    ("fr", re.compile(r"[àâçéèêëïîôùûü]", re.IGNORECASE)),
+    ("de", re.compile(r"[äöüß]", re.IGNORECASE)),
+    ("es", re.compile(r"[áéíóúñ]", re.IGNORECASE)),
+    ("it", re.compile(r"[àèéìíòóùú]", re.IGNORECASE)),
+    ("zh", re.compile(r"[\u4e00-\u9fff]")),
+    ("ja", re.compile(r"[\u3040-\u309f\u30a0-\u30ff]")),
+    ("hi", re.compile(r"[\u0900-\u097f]")),
+)
+_ANY_LANGUAGE_CHAR = re.compile(
+    r"(?i:[àâçéèêëïîôùûü]|[äöüß]|[áéíóúñ]|[àèéìíòóùú])"
+    r"|[\u4e00-\u9fff]|[\u3040-\u309f\u30a0-\u30ff]|[\u0900-\u097f]"
+)
+
+# Name confidence boosts. Both are plain substring tests ("Herrera" contains
+# "Herr", "baby" contains "by"), so the alternations have no word boundaries.
+_NAME_TITLES = (
+    "Mr.", "Mrs.", "Ms.", "Dr.", "Prof.", "Sr.", "Sra.",
+    "M.", "Mme.", "Herr", "Frau", "Sig.", "Sig.ra",
+)
+_NAME_INDICATORS = (
+    "name", "called", "by", "author", "contact", "person",
+    "nom", "nombre", "nome",
+)
+_NAME_TITLE_RE = re.compile("|".join(map(re.escape, _NAME_TITLES)))
+_NAME_INDICATOR_RE = re.compile("|".join(map(re.escape, _NAME_INDICATORS)))
+
+# Confidence multipliers for matches that fail their type's validator
+_VALIDATION_PENALTIES = {"VIN": 0.7, "IBAN": 0.6, "BITCOIN_ADDRESS": 0.8}
+
+# Deletes every ASCII character that is not a digit, for _digits_only
+_ASCII_NON_DIGITS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isdecimal())
+)
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
+def _digits_only(value: str) -> str:
+    r"""Return the decimal digits of value, like re.sub(r"\D", "", value)."""
+    if value.isascii():
+        return value.translate(_ASCII_NON_DIGITS)
+    # Non-ASCII text may hold other decimal digits, which \D also keeps
+    return _NON_DIGIT_RE.sub("", value)
+
+
+# Digit sum of 2*d for d in 0-9, as used by the Luhn checksum
+_LUHN_DOUBLE = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+@lru_cache(maxsize=4096)
+def _luhn_valid(number: str) -> bool:
+    """Luhn checksum of a digit string; cached since dumps repeat card numbers."""
+    if len(number) < 13:
+        return False
+
+    if number.isascii():
+        if not number.isdigit():
+            return False
+        # ASCII digits are bytes 48-57, so subtract the offset instead of int()
+        digits = number.encode()
+        odd_digits = digits[-1::-2]
+        checksum = sum(odd_digits) - 48 * len(odd_digits)
+        for b in digits[-2::-2]:
+            checksum += _LUHN_DOUBLE[b - 48]
+        return checksum % 10 == 0
+
+    # Other Unicode decimal digits (e.g. Arabic-Indic) are valid int() input
+    try:
+        digits = [int(d) for d in number]
+    except ValueError:
+        return False
+    checksum = sum(digits[-1::-2])
+    for d in digits[-2::-2]:
+        checksum += _LUHN_DOUBLE[d]
+    return checksum % 10 == 0
+
+
+# Validators are pure functions of the matched text. They live at module
+# level so their caches are shared and do not keep detectors alive;
+# detect() validates some values twice, and dumps repeat values.
+
+@lru_cache(maxsize=4096)
+def _vin_valid(vin: str) -> bool:
+    """Validate VIN (Vehicle Identification Number)."""
+    if len(vin) != 17:
+        return False
+    if any(char in vin.upper() for char in "IOQ"):
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _iban_valid(iban: str) -> bool:
+    """Validate IBAN format."""
+    iban = iban.replace(" ", "").upper()
+    if len(iban) < 15 or len(iban) > 34:
+        return False
+    if not iban[:2].isalpha():
+        return False
+    if not iban[2:4].isdigit():
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _bitcoin_valid(address: str) -> bool:
+    """Basic Bitcoin address validation."""
+    if len(address) < 26 or len(address) > 62:
+        return False
+    if not (address[0] in "13" or address.startswith("bc1")):
+        return False
+    invalid_chars = set("0OIl")
+    if any(c in invalid_chars for c in address[1:]):
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _ssn_valid(ssn: str) -> bool:
+    """Validate SSN format."""
+    ssn_clean = _digits_only(ssn)
+    if len(ssn_clean) != 9:
+        return False
+    if ssn_clean[:3] == "000" or ssn_clean[3:5] == "00" or ssn_clean[5:] == "0000":
+        return False
+    if ssn_clean[:3] == "666" or ssn_clean[:3] >= "900":
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _ip_valid(ip: str) -> bool:
+    """Validate IP address."""
+    try:
+        parts = ip.split(".")
+        return len(parts) == 4 and all(0 <= int(part) <= 255 for part in parts)
+    except Exception:
+        return False
+
+
+class _SpanIndex:
+    """Sorted, disjoint [start, end) spans with O(log n) overlap queries.
+
+    Overlapping input spans are merged; spans that merely touch are kept
+    apart, so a query touching a span's edge does not count as overlap,
+    matching ``PIIDetector._is_overlapping``.
+    """
+
+    def __init__(self, entities: List[PIIEntity]):
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        for entity in sorted(entities, key=_by_start):
+            if self.ends and entity.start < self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], entity.end)
+            else:
+                self.starts.append(entity.start)
+                self.ends.append(entity.end)
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """Return True if [start, end) overlaps any span."""
+        # First span ending after start; spans are disjoint, so ends are sorted
+        i = bisect_right(self.ends, start)
+        return i < len(self.starts) and self.starts[i] < end
+
+    def add(self, start: int, end: int) -> None:
+        """Insert a span that does not overlap any existing one."""
+        i = bisect_right(self.ends, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+
 
 class PIIDetector:
     """
@@ -39,8 +236,19 @@ class PIIDetector:
         'EMAIL'
     """
 
+    # Compiled regexes shared by every instance, keyed by (pattern, flags)
+    _COMPILED: ClassVar[Dict[Tuple[str, int], "re.Pattern[str]"]] = {}
+
+    # Shortest text any built-in pattern can match (LICENSE_PLATE, e.g. "AB1").
+    # Subclasses adding shorter patterns must lower it.
+    _MIN_MATCH_LENGTH: ClassVar[int] = 3
+
     def __init__(self):
-        # Comprehensive patterns with context keywords for accuracy
+        # Comprehensive patterns with context keywords for accuracy.
+        # Optional "required_substrings" lists lowercase literals, one of
+        # which every match must contain; detect() skips the pattern when
+        # none occur in the text. "requires_digit" marks patterns whose
+        # every match contains a decimal digit, skipped on digit-free text.
         self.patterns = {
             # Financial Identifiers
             "SSN": {
@@ -49,6 +257,7 @@ class PIIDetector:
                     "ssn", "social", "security", "tax", "tin", "taxpayer",
                 ],
                 "confidence_base": 0.95,
+                "requires_digit": True,
             },
             "CREDIT_CARD": {
                 "pattern": r"\b(?:4[0-9]{12}(?:[0-9]{3})?|5[1-5][0-9]{14}|3[47][0-9]{13}|3(?:0[0-5]|[68][0-9])[0-9]{11}|6(?:011|5[0-9]{2})[0-9]{12}|(?:2131|1800|35\d{3})\d{11})\b",
@@ -56,6 +265,7 @@ class PIIDetector:
                     "card", "credit", "visa", "mastercard", "amex", "payment", "cc",
                 ],
                 "confidence_base": 0.98,
+                "requires_digit": True,
             },
             "IBAN": {
                 "pattern": r"\b[A-Z]{2}[0-9]{2}[A-Z0-9]{4}[0-9]{7}([A-Z0-9]?){0,16}\b",
@@ -63,6 +273,7 @@ class PIIDetector:
                     "iban", "swift", "bank", "transfer", "wire", "sepa", "bic",
                 ],
                 "confidence_base": 0.96,
+                "requires_digit": True,
             },
             "BITCOIN_ADDRESS": {
                 "pattern": r"\b(?:[13][a-km-zA-HJ-NP-Z1-9]{25,34}|bc1[a-z0-9]{39,59})\b",
@@ -70,6 +281,7 @@ class PIIDetector:
                     "bitcoin", "btc", "wallet", "crypto", "cryptocurrency", "address",
                 ],
                 "confidence_base": 0.94,
+                "requires_digit": True,
             },
             "ETHEREUM_ADDRESS": {
                 "pattern": r"\b0x[a-fA-F0-9]{40}\b",
@@ -77,17 +289,20 @@ class PIIDetector:
                     "ethereum", "eth", "wallet", "crypto", "address", "0x",
                 ],
                 "confidence_base": 0.93,
+                "required_substrings": ["0x"],
             },
             "ROUTING_NUMBER": {
                 "pattern": r"\b[0-9]{9}\b",
                 "context_keywords": ["routing", "aba", "rtn", "bank", "wire"],
                 "confidence_base": 0.88,
+                "requires_digit": True,
             },
             # Contact Information
             "EMAIL": {
                 "pattern": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
                 "context_keywords": ["email", "mail", "contact", "@", "address"],
                 "confidence_base": 0.99,
+                "required_substrings": ["@"],
             },
             "PHONE": {
                 "pattern": r"(?:\+?[1-9]\d{0,3}[-.\s]?)?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}",
@@ -95,6 +310,7 @@ class PIIDetector:
                     "phone", "call", "mobile", "cell", "tel", "contact", "number", "whatsapp",
                 ],
                 "confidence_base": 0.92,
+                "requires_digit": True,
             },
             "IP_ADDRESS": {
                 "pattern": r"\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\b",
@@ -102,16 +318,20 @@ class PIIDetector:
                     "ip", "address", "server", "host", "connection", "network",
                 ],
                 "confidence_base": 0.94,
+                "requires_digit": True,
+                "required_substrings": ["."],
             },
             "IPV6_ADDRESS": {
                 "pattern": r"\b(?:[A-Fa-f0-9]{1,4}:){7}[A-Fa-f0-9]{1,4}\b",
                 "context_keywords": ["ipv6", "ip", "address", "network", "server"],
                 "confidence_base": 0.93,
+                "required_substrings": [":"],
             },
             "MAC_ADDRESS": {
                 "pattern": r"\b(?:[0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}\b",
                 "context_keywords": ["mac", "address", "hardware", "network", "device"],
                 "confidence_base": 0.91,
+                "required_substrings": [":", "-"],
             },
             # Personal Identifiers
             "DATE_OF_BIRTH": {
@@ -120,6 +340,8 @@ class PIIDetector:
                     "birth", "born", "dob", "birthday", "date of birth", "age",
                 ],
                 "confidence_base": 0.88,
+                "requires_digit": True,
+                "required_substrings": ["/", "-"],
             },
             "DRIVER_LICENSE": {
                 "pattern": r"\b(?:[A-Z][0-9]{7,12}|[0-9]{7,12}[A-Z]?)\b",
@@ -127,6 +349,7 @@ class PIIDetector:
                     "driver", "license", "dl", "dmv", "driving", "licence",
                 ],
                 "confidence_base": 0.85,
+                "requires_digit": True,
             },
             "PASSPORT": {
                 "pattern": r"\b[A-Z][0-9]{8}\b",
@@ -134,6 +357,7 @@ class PIIDetector:
                     "passport", "travel", "document", "visa", "immigration",
                 ],
                 "confidence_base": 0.87,
+                "requires_digit": True,
             },
             "VIN": {
                 "pattern": r"\b[A-HJ-NPR-Z0-9]{17}\b",
@@ -156,6 +380,7 @@ class PIIDetector:
                     "patient", "medical", "record", "mrn", "health", "hospital", "clinic",
                 ],
                 "confidence_base": 0.96,
+                "required_substrings": ["mrn", "patient id", "medical record"],
             },
             "MEDICARE": {
                 "pattern": r"\b[0-9]{3}-[0-9]{2}-[0-9]{4}[A-Z]\b",
@@ -163,6 +388,8 @@ class PIIDetector:
                     "medicare", "cms", "health", "insurance", "beneficiary",
                 ],
                 "confidence_base": 0.91,
+                "requires_digit": True,
+                "required_substrings": ["-"],
             },
             "DEA_NUMBER": {
                 "pattern": r"\b[A-Z]{2}[0-9]{7}\b",
@@ -170,6 +397,7 @@ class PIIDetector:
                     "dea", "prescriber", "drug", "enforcement", "prescription", "doctor",
                 ],
                 "confidence_base": 0.89,
+                "requires_digit": True,
             },
             "NPI": {
                 "pattern": r"\b[0-9]{10}\b",
@@ -177,22 +405,26 @@ class PIIDetector:
                     "npi", "provider", "national", "identifier", "healthcare",
                 ],
                 "confidence_base": 0.87,
+                "requires_digit": True,
             },
             # Government IDs (International)
             "UK_NINO": {
                 "pattern": r"\b[A-Z]{2}[0-9]{6}[A-Z]\b",
                 "context_keywords": ["nino", "national insurance", "ni number", "uk"],
                 "confidence_base": 0.90,
+                "requires_digit": True,
             },
             "CANADA_SIN": {
                 "pattern": r"\b[0-9]{3}[-\s]?[0-9]{3}[-\s]?[0-9]{3}\b",
                 "context_keywords": ["sin", "social insurance", "canada", "canadian"],
                 "confidence_base": 0.89,
+                "requires_digit": True,
             },
             "FRANCE_INSEE": {
                 "pattern": r"\b[12][0-9]{2}[0-1][0-9][0-9]{8}[0-9]{2}\b",
                 "context_keywords": ["insee", "securite sociale", "france", "french"],
                 "confidence_base": 0.88,
+                "requires_digit": True,
             },
             "GERMANY_STEUER": {
                 "pattern": r"\b[0-9]{2}\s?[0-9]{3}\s?[0-9]{3}\s?[0-9]{3}\b",
@@ -200,16 +432,19 @@ class PIIDetector:
                     "steuer", "steuernummer", "tax", "german", "deutschland",
                 ],
                 "confidence_base": 0.87,
+                "requires_digit": True,
             },
             "INDIA_AADHAAR": {
                 "pattern": r"\b[0-9]{4}[-\s]?[0-9]{4}[-\s]?[0-9]{4}\b",
                 "context_keywords": ["aadhaar", "uid", "india", "indian", "identity"],
                 "confidence_base": 0.91,
+                "requires_digit": True,
             },
             "INDIA_PAN": {
                 "pattern": r"\b[A-Z]{5}[0-9]{4}[A-Z]\b",
                 "context_keywords": ["pan", "permanent account", "tax", "india"],
                 "confidence_base": 0.90,
+                "requires_digit": True,
             },
             # Bank Account Formats
             "BANK_ACCOUNT": {
@@ -218,6 +453,7 @@ class PIIDetector:
                     "account", "bank", "checking", "savings", "deposit",
                 ],
                 "confidence_base": 0.83,
+                "requires_digit": True,
             },
             "SWIFT_CODE": {
                 "pattern": r"\b[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}([A-Z0-9]{3})?\b",
@@ -229,6 +465,7 @@ class PIIDetector:
                 "pattern": r"\b(?:EMP|EMPLOYEE|ID)[:\s]?[A-Z0-9]{5,10}\b",
                 "context_keywords": ["employee", "emp", "staff", "worker", "personnel"],
                 "confidence_base": 0.88,
+                "required_substrings": ["emp", "id"],
             },
             "TAX_ID": {
                 "pattern": r"\b[0-9]{2}-[0-9]{7}\b",
@@ -236,6 +473,8 @@ class PIIDetector:
                     "ein", "tax", "employer", "identification", "federal",
                 ],
                 "confidence_base": 0.89,
+                "requires_digit": True,
+                "required_substrings": ["-"],
             },
         }
 
@@ -271,9 +510,43 @@ class PIIDetector:
             r"\b[A-Z][0-9][A-Z]\s*[0-9][A-Z][0-9]\b",
         ]
 
+        # Compiled once per process; later detectors only look them up
+        self._compiled_patterns = self._get_compiled_patterns(self.patterns)
+        self._name_regexes = [self._compile(p, 0) for p in self.name_patterns]
+        self._address_regexes = [
+            (self._compile(p, re.IGNORECASE), _ADDRESS_GATES.get(p))
+            for p in self.address_patterns
+        ]
+
+        # Validators whose failure lowers a match's confidence (see detect)
+        self._pattern_validators = {
+            "VIN": self._validate_vin,
+            "IBAN": self._validate_iban,
+            "BITCOIN_ADDRESS": self._validate_bitcoin,
+        }
+
         # ML-like weights for confidence scoring
         self._load_entity_weights()
 
+    @classmethod
+    def _compile(cls, pattern: str, flags: int) -> "re.Pattern[str]":
+        """Return the shared compiled regex for (pattern, flags)."""
+        key = (pattern, flags)
+        regex = cls._COMPILED.get(key)
+        if regex is None:
+            regex = cls._COMPILED[key] = re.compile(pattern, flags)
+        return regex
+
+    @classmethod
+    def _get_compiled_patterns(
+        cls, patterns: Dict[str, Dict[str, Any]]
+    ) -> List[Tuple[str, Dict[str, Any], "re.Pattern[str]"]]:
+        """Return (pii_type, config, regex) triples, compiling each pattern only once."""
+        return [
+            (pii_type, config, cls._compile(config["pattern"], re.IGNORECASE))
+            for pii_type, config in patterns.items()
+        ]
+
     def _load_entity_weights(self):
         """Load entity weights for confidence calculation."""
         self.entity_weights = {
@@ -318,6 +591,12 @@ class PIIDetector:
             "BANK_ACCOUNT": 0.92,
         }
 
+        # Both factors are fixed per pattern type, so multiply them once here
+        self._weighted_base = {
+            pii_type: config["confidence_base"] * self.entity_weights.get(pii_type, 0.85)
+            for pii_type, config in self.patterns.items()
+        }
+
     def detect(self, text: str) -> List[PIIEntity]:
         """
         Detect PII entities in text.
@@ -334,53 +613,91 @@ class PIIDetector:
             >>> print(entities[0].label)
             'EMAIL'
         """
+        # Strings such as "", "NY", "---" or "日本語" cannot match any pattern
+        if len(text) < self._MIN_MATCH_LENGTH or not _CANDIDATE_CHARS.search(text):
+            return []
+
         entities = []
 
         # Detect language
         language = self._detect_language(text)
 
-        # 1. Pattern-based detection with context scoring
-        for pii_type, config in self.patterns.items():
-            pattern = re.compile(config["pattern"], re.IGNORECASE)
+        # Lowercase once for context scoring. Offsets only line up with text if
+        # no character changes length when lowercased (e.g. "İ"); otherwise the
+        # scorers lowercase each window themselves.
+        text_lower = text.lower()
+        if len(text_lower) != len(text):
+            text_lower = None
+
+        # Required-substring hints are only checked on ASCII text: elsewhere
+        # IGNORECASE also matches letters like "ı" and "ſ" that lower() keeps
+        prefilter_text = text_lower if text.isascii() else None
+        # \d also matches non-ASCII decimal digits, so this holds for any text
+        has_digit = _ANY_DIGIT.search(text) is not None
+
+        # Candidates are built with an empty context; about half of them are
+        # dropped by voting and filtering, so only survivors get it (step 6).
+
+        # 1. Pattern-based detection with context scoring. Bound methods and
+        # per-pattern config are looked up once, not per match.
+        score_context = self._calculate_context_score
+        score_confidence = self._calculate_confidence
+        append = entities.append
+        for pii_type, config, pattern in self._compiled_patterns:
+            keywords = config["context_keywords"]
+            base_confidence = config["confidence_base"]
+            validate = self._pattern_validators.get(pii_type)
+            if not has_digit and config.get("requires_digit"):
+                continue
+            required = config.get("required_substrings")
+            if required and prefilter_text is not None and not any(
+                literal in prefilter_text for literal in required
+            ):
+                continue
             for match in pattern.finditer(text):
+                value = match.group()
+                start, end = match.span()
+
                 # Context validation
-                context_score = self._calculate_context_score(
-                    text, match, config["context_keywords"]
-                )
+                context_score = score_context(text, start, end, keywords, text_lower)
+
+                # Validate once; the result drives both the boost and the penalty
+                valid = validate(value) if validate is not None else None
 
                 # Confidence calculation
-                confidence = self._calculate_confidence(
-                    pii_type, match.group(), context_score, config["confidence_base"]
+                confidence = score_confidence(
+                    pii_type, value, context_score, base_confidence, valid
                 )
 
                 # Apply type-specific validation
-                if pii_type == "VIN" and not self._validate_vin(match.group()):
-                    confidence *= 0.7
-                elif pii_type == "IBAN" and not self._validate_iban(match.group()):
-                    confidence *= 0.6
-                elif pii_type == "BITCOIN_ADDRESS" and not self._validate_bitcoin(match.group()):
-                    confidence *= 0.8
+                if valid is False:
+                    confidence *= _VALIDATION_PENALTIES[pii_type]
 
                 if confidence > 0.75:
-                    entities.append(
+                    append(
                         PIIEntity(
-                            text=match.group(),
+                            text=value,
                             label=pii_type,
-                            start=match.start(),
-                            end=match.end(),
+                            start=start,
+                            end=end,
                             confidence=min(0.99, confidence),
-                            context=self._extract_context(text, match),
+                            context="",
                             language=language,
                         )
                     )
 
+        # Names and addresses are only kept where nothing was found yet
+        spans = _SpanIndex(entities)
+
         # 2. Named entity recognition (Names) - Multilingual
-        for pattern in self.name_patterns:
-            name_regex = re.compile(pattern)
+        for name_regex in self._name_regexes:
             for match in name_regex.finditer(text):
-                if not self._is_overlapping(match.start(), match.end(), entities):
-                    confidence = self._calculate_name_confidence(match.group(), text, match)
+                if not spans.overlaps(match.start(), match.end()):
+                    confidence = self._calculate_name_confidence(
+                        match.group(), text, match.start(), match.end(), text_lower
+                    )
                     if confidence > 0.80:
+                        spans.add(match.start(), match.end())
                         entities.append(
                             PIIEntity(
                                 text=match.group(),
@@ -388,16 +705,18 @@ class PIIDetector:
                                 start=match.start(),
                                 end=match.end(),
                                 confidence=min(0.99, confidence),
-                                context=self._extract_context(text, match),
+                                context="",
                                 language=language,
                             )
                         )
 
         # 3. Address detection - International formats
-        for pattern in self.address_patterns:
-            addr_regex = re.compile(pattern, re.IGNORECASE)
+        for addr_regex, gate in self._address_regexes:
+            if gate is not None and gate.search(text) is None:
+                continue
             for match in addr_regex.finditer(text):
-                if not self._is_overlapping(match.start(), match.end(), entities):
+                if not spans.overlaps(match.start(), match.end()):
+                    spans.add(match.start(), match.end())
                     entities.append(
                         PIIEntity(
                             text=match.group(),
@@ -405,7 +724,7 @@ class PIIDetector:
                             start=match.start(),
                             end=match.end(),
                             confidence=0.95,
-                            context=self._extract_context(text, match),
+                            context="",
                             language=language,
                         )
                     )
@@ -416,104 +735,67 @@ class PIIDetector:
         # 5. Final filtering for precision
         entities = self._filter_entities(entities)
 
-        return sorted(entities, key=lambda x: x.start)
+        # 6. Attach surrounding context to the entities that were kept
+        for entity in entities:
+            entity.context = self._context_window(text, entity.start, entity.end)
+
+        return sorted(entities, key=_by_start)
 
     def _detect_language(self, text: str) -> str:
         """Detect language based on character patterns."""
-        if re.search(r"[àâçéèêëïîôùûü]", text, re.IGNORECASE):
-            return "fr"
-        elif re.search(r"[äöüß]", text, re.IGNORECASE):
-            return "de"
-        elif re.search(r"[áéíóúñ]", text, re.IGNORECASE):
-            return "es"
-        elif re.search(r"[àèéìíòóùú]", text, re.IGNORECASE):
-            return "it"
-        elif re.search(r"[\u4e00-\u9fff]", text):
-            return "zh"
-        elif re.search(r"[\u3040-\u309f\u30a0-\u30ff]", text):
-            return "ja"
-        elif re.search(r"[\u0900-\u097f]", text):
-            return "hi"
+        # Plain ASCII/Latin text is the common case: one scan instead of seven
+        if not _ANY_LANGUAGE_CHAR.search(text):
+            return "en"
+        # The first matching script wins, wherever it occurs in the text
+        for language, chars in _LANGUAGE_CHARS:
+            if chars.search(text):
+                return language
         return "en"
 
     def _validate_vin(self, vin: str) -> bool:
         """Validate VIN (Vehicle Identification Number)."""
-        if len(vin) != 17:
-            return False
-        if any(char in vin.upper() for char in "IOQ"):
-            return False
-        return True
+        return _vin_valid(vin)
 
     def _validate_iban(self, iban: str) -> bool:
         """Validate IBAN format."""
-        iban = iban.replace(" ", "").upper()
-        if len(iban) < 15 or len(iban) > 34:
-            return False
-        if not iban[:2].isalpha():
-            return False
-        if not iban[2:4].isdigit():
-            return False
-        return True
+        return _iban_valid(iban)
 
     def _validate_bitcoin(self, address: str) -> bool:
         """Basic Bitcoin address validation."""
-        if len(address) < 26 or len(address) > 62:
-            return False
-        if not (address[0] in "13" or address.startswith("bc1")):
-            return False
-        invalid_chars = set("0OIl")
-        if any(c in invalid_chars for c in address[1:]):
-            return False
-        return True
+        return _bitcoin_valid(address)
 
     def _validate_ssn(self, ssn: str) -> bool:
         """Validate SSN format."""
-        ssn_clean = re.sub(r"\D", "", ssn)
-        if len(ssn_clean) != 9:
-            return False
-        if ssn_clean[:3] == "000" or ssn_clean[3:5] == "00" or ssn_clean[5:] == "0000":
-            return False
-        if ssn_clean[:3] == "666" or ssn_clean[:3] >= "900":
-            return False
-        return True
+        return _ssn_valid(ssn)
 
     def _luhn_check(self, number: str) -> bool:
         """Validate credit card using Luhn algorithm."""
-        if not number or len(number) < 13:
-            return False
-
-        def digits_of(n):
-            return [int(d) for d in str(n)]
-
-        try:
-            digits = digits_of(number)
-            odd_digits = digits[-1::-2]
-            even_digits = digits[-2::-2]
-
-            checksum = sum(odd_digits)
-            for d in even_digits:
-                checksum += sum(digits_of(d * 2))
-
-            return checksum % 10 == 0
-        except Exception:
-            return False
+        return _luhn_valid(number)
 
     def _validate_ip(self, ip: str) -> bool:
         """Validate IP address."""
-        try:
-            parts = ip.split(".")
-            return len(parts) == 4 and all(0 <= int(part) <= 255 for part in parts)
-        except Exception:
-            return False
+        return _ip_valid(ip)
 
     def _calculate_context_score(
-        self, text: str, match: re.Match, keywords: List[str]
+        self,
+        text: str,
+        start: int,
+        end: int,
+        keywords: List[str],
+        text_lower: Optional[str] = None,
     ) -> float:
-        """Calculate context relevance score."""
+        """Calculate context relevance score.
+
+        ``text_lower`` is ``text.lower()`` when its offsets match ``text``;
+        the context window is sliced from it instead of lowercased per call.
+        """
         context_window = 100
-        start = max(0, match.start() - context_window)
-        end = min(len(text), match.end() + context_window)
-        context = text[start:end].lower()
+        start = max(0, start - context_window)
+        end = min(len(text), end + context_window)
+        if text_lower is not None:
+            context = text_lower[start:end]
+        else:
+            context = text[start:end].lower()
 
         score = 0.0
         for keyword in keywords:
@@ -523,44 +805,58 @@ class PIIDetector:
         return min(1.0, score)
 
     def _calculate_confidence(
-        self, pii_type: str, value: str, context_score: float, base_confidence: float
+        self,
+        pii_type: str,
+        value: str,
+        context_score: float,
+        base_confidence: float,
+        valid: Optional[bool] = None,
     ) -> float:
-        """Calculate confidence score for detection."""
-        confidence = base_confidence
-        ml_weight = self.entity_weights.get(pii_type, 0.85)
-        confidence *= ml_weight
+        """Calculate confidence score for detection.
+
+        Types with a configured pattern use the base-times-weight product
+        precomputed by ``_load_entity_weights``; ``base_confidence`` is only
+        used for other types. ``valid`` is the VIN/IBAN/Bitcoin validator
+        result when the caller already has it.
+        """
+        confidence = self._weighted_base.get(pii_type)
+        if confidence is None:
+            confidence = base_confidence * self.entity_weights.get(pii_type, 0.85)
         confidence += context_score * 0.1
 
         # Type-specific validation boosts
         if pii_type == "SSN" and self._validate_ssn(value):
             confidence += 0.05
-        elif pii_type == "CREDIT_CARD" and self._luhn_check(re.sub(r"\D", "", value)):
+        elif pii_type == "CREDIT_CARD" and self._luhn_check(_digits_only(value)):
             confidence += 0.08
         elif pii_type == "EMAIL" and "@" in value and "." in value.split("@")[1]:
             confidence += 0.03
         elif pii_type == "IP_ADDRESS" and self._validate_ip(value):
             confidence += 0.04
-        elif pii_type == "VIN" and self._validate_vin(value):
+        elif pii_type == "VIN" and (self._validate_vin(value) if valid is None else valid):
             confidence += 0.06
-        elif pii_type == "IBAN" and self._validate_iban(value):
+        elif pii_type == "IBAN" and (self._validate_iban(value) if valid is None else valid):
             confidence += 0.07
-        elif pii_type == "BITCOIN_ADDRESS" and self._validate_bitcoin(value):
+        elif pii_type == "BITCOIN_ADDRESS" and (
+            self._validate_bitcoin(value) if valid is None else valid
+        ):
             confidence += 0.05
 
         return min(0.99, confidence)
 
     def _calculate_name_confidence(
-        self, name: str, text: str, match: re.Match
+        self,
+        name: str,
+        text: str,
+        start: int,
+        end: int,
+        text_lower: Optional[str] = None,
     ) -> float:
         """Calculate confidence for name detection."""
         confidence = 0.88
 
         # Check for title prefix
-        titles = [
-            "Mr.", "Mrs.", "Ms.", "Dr.", "Prof.", "Sr.", "Sra.",
-            "M.", "Mme.", "Herr", "Frau", "Sig.", "Sig.ra",
-        ]
-        if any(title in name for title in titles):
+        if _NAME_TITLE_RE.search(name):
             confidence += 0.08
 
         # Check capitalization
@@ -568,13 +864,14 @@ class PIIDetector:
         if all(word[0].isupper() for word in words if word):
             confidence += 0.05
 
-        # Check context
-        context = self._extract_context(text, match).lower()
-        name_indicators = [
-            "name", "called", "by", "author", "contact", "person",
-            "nom", "nombre", "nome",
-        ]
-        if any(indicator in context for indicator in name_indicators):
+        # Check context (same 50-char window as _context_window)
+        window_start = max(0, start - 50)
+        window_end = min(len(text), end + 50)
+        if text_lower is not None:
+            context = text_lower[window_start:window_end]
+        else:
+            context = text[window_start:window_end].lower()
+        if _NAME_INDICATOR_RE.search(context):
             confidence += 0.06
 
         return min(0.99, confidence)
@@ -588,31 +885,48 @@ class PIIDetector:
 
     def _extract_context(self, text: str, match: re.Match, window: int = 50) -> str:
         """Extract context around match."""
-        start = max(0, match.start() - window)
-        end = min(len(text), match.end() + window)
-        return text[start:end]
+        return self._context_window(text, match.start(), match.end(), window)
+
+    def _context_window(self, text: str, start: int, end: int, window: int = 50) -> str:
+        """Extract context around the span [start, end)."""
+        return text[max(0, start - window) : min(len(text), end + window)]
 
     def _ensemble_voting(self, entities: List[PIIEntity], text: str) -> List[PIIEntity]:
         """Apply ensemble voting for overlapping entities."""
-        merged = []
+        # Each entity joins the earliest-created group holding a member it
+        # overlaps, else starts a new group. Members are indexed by start so
+        # only those that can reach the entity are checked: a member starting
+        # at or before start - max_len ends at or before start.
+        merged: List[List[PIIEntity]] = []
+        starts: List[int] = []
+        ends: List[int] = []
+        group_ids: List[int] = []
+        max_len = 0
         for entity in entities:
-            added = False
-            for i, group in enumerate(merged):
-                if any(
-                    not (entity.end <= e.start or entity.start >= e.end) for e in group
-                ):
-                    group.append(entity)
-                    added = True
-                    break
-            if not added:
+            lo = bisect_left(starts, entity.start - max_len + 1)
+            hi = bisect_left(starts, entity.end)
+            group_id = None
+            for j in range(lo, hi):
+                if ends[j] > entity.start and (group_id is None or group_ids[j] < group_id):
+                    group_id = group_ids[j]
+            if group_id is None:
+                group_id = len(merged)
                 merged.append([entity])
+            else:
+                merged[group_id].append(entity)
+
+            j = bisect_right(starts, entity.start)
+            starts.insert(j, entity.start)
+            ends.insert(j, entity.end)
+            group_ids.insert(j, group_id)
+            max_len = max(max_len, entity.end - entity.start)
 
         final_entities = []
         for group in merged:
             if len(group) == 1:
                 final_entities.append(group[0])
             else:
-                best = max(group, key=lambda x: x.confidence)
+                best = max(group, key=_by_confidence)
                 if len(group) > 2:
                     best = PIIEntity(
                         text=best.text,
@@ -672,16 +986,36 @@ class PIIDetector:
             'Email: [EMAIL:****]'
         """
         entities = self.detect(text)
-        redacted = text
 
         # Sort by position (reverse)
-        entities_sorted = sorted(entities, key=lambda x: x.start, reverse=True)
-
+        entities_sorted = sorted(entities, key=_by_start, reverse=True)
+        mask = mask_char * 4
+
+        # Masks are applied right to left, as if each replaced
+        # redacted[start:end] in turn. The string is always text[:boundary]
+        # followed by the already-redacted tail, kept as parts in reverse
+        # order, so each step costs O(entity) instead of copying the text.
+        # Overlapping entities cut into the tail exactly as slicing would.
+        boundary = len(text)
+        tail: List[str] = []
         for entity in entities_sorted:
-            mask = f"[{entity.label}:{mask_char * 4}]"
-            redacted = redacted[: entity.start] + mask + redacted[entity.end :]
-
-        return redacted, entities
+            if entity.end <= boundary:
+                tail.append(text[entity.end : boundary])
+            else:
+                drop = entity.end - boundary
+                while drop and tail:
+                    part = tail.pop()
+                    if len(part) > drop:
+                        tail.append(part[drop:])
+                        drop = 0
+                    else:
+                        drop -= len(part)
+            tail.append(f"[{entity.label}:{mask}]")
+            boundary = entity.start
+
+        tail.append(text[:boundary])
+        tail.reverse()
+        return "".join(tail), entities
 
     def get_statistics(self, entities: List[PIIEntity]) -> Dict[str, Any]:
         """
@@ -696,30 +1030,28 @@ class PIIDetector:
         if not entities:
             return {"total": 0, "by_type": {}, "by_language": {}, "avg_confidence": 0}
 
-        by_type: Dict[str, Dict[str, Any]] = {}
-        by_language: Dict[str, int] = {}
+        counts: Dict[str, int] = defaultdict(int)
+        confidence_sums: Dict[str, float] = defaultdict(float)
+        by_language: Dict[str, int] = defaultdict(int)
+        total_confidence = 0.0
 
+        # One pass with running sums; no per-type lists of confidences
         for entity in entities:
-            if entity.label not in by_type:
-                by_type[entity.label] = {"count": 0, "confidences": []}
-            by_type[entity.label]["count"] += 1
-            by_type[entity.label]["confidences"].append(entity.confidence)
-
-            if entity.language not in by_language:
-                by_language[entity.language] = 0
+            counts[entity.label] += 1
+            confidence_sums[entity.label] += entity.confidence
             by_language[entity.language] += 1
+            total_confidence += entity.confidence
 
-        for pii_type in by_type:
-            by_type[pii_type]["avg_confidence"] = statistics.mean(
-                by_type[pii_type]["confidences"]
-            )
-            del by_type[pii_type]["confidences"]
+        by_type = {
+            pii_type: {"count": count, "avg_confidence": confidence_sums[pii_type] / count}
+            for pii_type, count in counts.items()
+        }
 
         return {
             "total": len(entities),
             "by_type": by_type,
-            "by_language": by_language,
-            "avg_confidence": statistics.mean([e.confidence for e in entities]),
+            "by_language": dict(by_language),
+            "avg_confidence": total_confidence / len(entities),
         }
 
 
@@ -110,12 +110,13 @@ class PIIEntity:
     @classmethod
     def from_dict(cls, data: dict) -> "PIIEntity":
         """Create entity from dictionary."""
+        # Positional in field order; keyword binding costs more than the body
         return cls(
-            text=data["text"],
-            label=data["label"],
-            start=data["start"],
-            end=data["end"],
-            confidence=data["confidence"],
-            context=data.get("context", ""),
-            language=data.get("language", "en"),
+            data["text"],
+            data["label"],
+            data["start"],
+            data["end"],
+            data["confidence"],
+            data.get("context", ""),
+            data.get("language", "en"),
         )
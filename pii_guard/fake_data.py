@@ -20,8 +20,12 @@ Example:
 """
 
 import random
-import hashlib
-from typing import Optional, Dict, Any
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from typing import Optional, Dict, Any, List, NamedTuple, Callable, Sequence, TypeVar
 from dataclasses import dataclass
 
 
@@ -36,7 +40,7 @@ class Locale:
 # Name Data
 # ============================================================================
 
-FIRST_NAMES_EN = [
+FIRST_NAMES_EN = (
     # Male names
     "James", "Robert", "John", "Michael", "David", "William", "Richard", "Joseph",
     "Thomas", "Christopher", "Charles", "Daniel", "Matthew", "Anthony", "Mark",
@@ -53,33 +57,33 @@ FIRST_NAMES_EN = [
     "Angela", "Shirley", "Anna", "Brenda", "Pamela", "Emma", "Nicole", "Helen",
     "Samantha", "Katherine", "Christine", "Debra", "Rachel", "Carolyn", "Janet", "Catherine",
     "Maria", "Heather", "Diane", "Ruth",
-]
+)
 
-FIRST_NAMES_ES = [
+FIRST_NAMES_ES = (
     "José", "Carlos", "Miguel", "Juan", "Luis", "Antonio", "Francisco", "Pedro",
     "Manuel", "Alejandro", "Ricardo", "Fernando", "Roberto", "Diego", "Andrés",
     "María", "Carmen", "Ana", "Isabel", "Rosa", "Patricia", "Laura", "Elena",
     "Lucia", "Marta", "Paula", "Sandra", "Cristina", "Raquel", "Teresa",
-]
+)
 
-FIRST_NAMES_FR = [
+FIRST_NAMES_FR = (
     "Jean", "Pierre", "Michel", "André", "Philippe", "Jacques", "Bernard", "François",
     "Louis", "Henri", "Marie", "Jeanne", "Catherine", "Françoise", "Monique",
     "Nicole", "Sylvie", "Nathalie", "Isabelle", "Sophie",
-]
+)
 
-FIRST_NAMES_DE = [
+FIRST_NAMES_DE = (
     "Hans", "Klaus", "Wolfgang", "Peter", "Michael", "Thomas", "Andreas", "Stefan",
     "Markus", "Christian", "Anna", "Maria", "Elisabeth", "Monika", "Ursula",
     "Petra", "Sabine", "Claudia", "Susanne", "Birgit",
-]
+)
 
-FIRST_NAMES_JP = [
+FIRST_NAMES_JP = (
     "太郎", "次郎", "健太", "大輔", "翔太", "拓也", "直樹", "雄太", "達也", "剛",
     "花子", "美咲", "さくら", "優子", "真由美", "愛", "美穂", "恵", "裕子", "明美",
-]
+)
 
-LAST_NAMES_EN = [
+LAST_NAMES_EN = (
     "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
     "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
     "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
@@ -90,47 +94,55 @@ LAST_NAMES_EN = [
     "Collins", "Edwards", "Stewart", "Morris", "Rogers", "Reed",
     "Cook", "Morgan", "Bell", "Murphy", "Bailey", "Cooper", "Richardson", "Cox",
     "Howard", "Ward", "Peterson", "Gray", "James", "Watson", "Brooks", "Kelly",
-]
+)
 
-LAST_NAMES_ES = [
+LAST_NAMES_ES = (
     "García", "Rodríguez", "Martínez", "López", "González", "Hernández", "Pérez",
     "Sánchez", "Ramírez", "Torres", "Flores", "Rivera", "Gómez", "Díaz", "Reyes",
     "Morales", "Jiménez", "Ruiz", "Álvarez", "Mendoza",
-]
+)
 
-LAST_NAMES_FR = [
+LAST_NAMES_FR = (
     "Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand",
     "Leroy", "Moreau", "Simon", "Laurent", "Lefebvre", "Michel", "Garcia",
-]
+)
 
-LAST_NAMES_DE = [
+LAST_NAMES_DE = (
     "Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer", "Wagner", "Becker",
     "Schulz", "Hoffmann", "Schäfer", "Koch", "Bauer", "Richter", "Klein",
-]
+)
 
-LAST_NAMES_JP = [
+LAST_NAMES_JP = (
     "佐藤", "鈴木", "高橋", "田中", "伊藤", "渡辺", "山本", "中村", "小林", "加藤",
     "吉田", "山田", "佐々木", "山口", "松本", "井上", "木村", "林", "斎藤", "清水",
-]
+)
+
+# Name lists by two-letter language prefix of the locale; others use English
+_LOCALE_NAMES = {
+    "es": (FIRST_NAMES_ES, LAST_NAMES_ES),
+    "fr": (FIRST_NAMES_FR, LAST_NAMES_FR),
+    "de": (FIRST_NAMES_DE, LAST_NAMES_DE),
+    "ja": (FIRST_NAMES_JP, LAST_NAMES_JP),
+}
 
 
 # ============================================================================
 # Address Data
 # ============================================================================
 
-STREET_NAMES = [
+STREET_NAMES = (
     "Main", "Oak", "Maple", "Cedar", "Pine", "Elm", "Washington", "Lake", "Hill",
     "Park", "View", "Forest", "River", "Spring", "Valley", "Sunset", "Highland",
     "Broadway", "Madison", "Jefferson", "Lincoln", "Franklin", "Adams", "Jackson",
     "Wilson", "Harrison", "Tyler", "Polk", "Taylor", "Fillmore", "Pierce",
-]
+)
 
-STREET_SUFFIXES = [
+STREET_SUFFIXES = (
     "Street", "Avenue", "Road", "Boulevard", "Drive", "Lane", "Way", "Court",
     "Place", "Circle", "Trail", "Parkway", "Commons", "Square", "Terrace",
-]
+)
 
-US_CITIES = [
+US_CITIES = (
     ("New York", "NY", "10001"),
     ("Los Angeles", "CA", "90001"),
     ("Chicago", "IL", "60601"),
@@ -161,9 +173,12 @@ US_CITIES = [
     ("Milwaukee", "WI", "53201"),
     ("Albuquerque", "NM", "87101"),
     ("Tucson", "AZ", "85701"),
-]
+)
+
+# US_CITIES with the ZIP already parsed, so address() only adds its offset
+_US_CITIES_INT = tuple((city, state, int(postal)) for city, state, postal in US_CITIES)
 
-UK_CITIES = [
+UK_CITIES = (
     ("London", "Greater London", "EC1A"),
     ("Birmingham", "West Midlands", "B1"),
     ("Manchester", "Greater Manchester", "M1"),
@@ -174,9 +189,9 @@ UK_CITIES = [
     ("Leeds", "West Yorkshire", "LS1"),
     ("Edinburgh", "Scotland", "EH1"),
     ("Leicester", "Leicestershire", "LE1"),
-]
+)
 
-CA_CITIES = [
+CA_CITIES = (
     ("Toronto", "ON", "M5V"),
     ("Montreal", "QC", "H2Y"),
     ("Vancouver", "BC", "V6B"),
@@ -187,40 +202,182 @@ CA_CITIES = [
     ("Quebec City", "QC", "G1R"),
     ("Hamilton", "ON", "L8P"),
     ("Halifax", "NS", "B3H"),
-]
+)
 
 
 # ============================================================================
 # Company and Domain Data
 # ============================================================================
 
-COMPANY_PREFIXES = [
+COMPANY_PREFIXES = (
     "Global", "United", "National", "American", "International", "Pacific",
     "Atlantic", "Northern", "Southern", "Western", "Eastern", "Central",
     "Premier", "Prime", "Elite", "Advanced", "Modern", "Dynamic", "Strategic",
-]
+)
 
-COMPANY_BASES = [
+COMPANY_BASES = (
     "Tech", "Systems", "Solutions", "Industries", "Services", "Group",
     "Corp", "Holdings", "Enterprises", "Partners", "Associates", "Networks",
     "Consulting", "Digital", "Media", "Software", "Data", "Cloud", "Labs",
-]
+)
 
-COMPANY_SUFFIXES = [
+COMPANY_SUFFIXES = (
     "Inc", "LLC", "Corp", "Ltd", "Co", "Group", "Holdings", "International",
-]
+)
 
-EMAIL_DOMAINS = [
+EMAIL_DOMAINS = (
     "example.com", "test.org", "sample.net", "demo.io", "fake.email",
     "mailtest.com", "testmail.org", "samplemail.net", "fakemail.io",
     "corporate.test", "business.example", "company.demo",
-]
+)
+
+_LOWERCASE = "abcdefghijklmnopqrstuvwxyz"
+
+# IPv6 groups as unpadded lowercase hex, as format(group, 'x') gives
+_unpack_ipv6_groups = struct.Struct(">8H").unpack
+_IPV6_FORMAT = ":".join(["%x"] * 8)
+
+# Zero-padded months and days for date(); days stop at 28 so any month works
+_MONTHS = tuple(f"{m:02d}" for m in range(1, 13))
+_DAYS = tuple(f"{d:02d}" for d in range(1, 29))
+# Number of distinct eight-letter email local parts
+_EMAIL_NAME_SPACE = 26 ** 8
 
 
 # ============================================================================
 # Fake Data Generator
 # ============================================================================
 
+_T = TypeVar("_T")
+
+
+def _choice(rng: random.Random, seq: Sequence[_T]) -> _T:
+    """
+    Pick a uniform element of a non-empty sequence.
+
+    Same draws as rng.choice() (rejection sampling on getrandbits), without
+    its method dispatch and nested _randbelow() call.
+    """
+    n = len(seq)
+    k = n.bit_length()
+    i = rng.getrandbits(k)
+    while i >= n:
+        i = rng.getrandbits(k)
+    return seq[i]
+
+
+def _phone_us(rng: random.Random) -> str:
+    area = rng.randint(200, 999)
+    exchange = rng.randint(200, 999)
+    subscriber = rng.randint(1000, 9999)
+    return f"+1-{area}-{exchange}-{subscriber}"
+
+
+def _phone_uk(rng: random.Random) -> str:
+    area = rng.randint(20, 79)
+    number = rng.randint(10000000, 99999999)
+    return f"+44-{area}-{number}"
+
+
+def _phone_intl(rng: random.Random) -> str:
+    country = rng.randint(1, 99)
+    number = rng.randint(1000000000, 9999999999)
+    return f"+{country}-{number}"
+
+
+def _phone_default(rng: random.Random) -> str:
+    return f"+1-555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
+
+
+# Phone formatters by format name; unknown formats use _phone_default
+_PHONE_FORMATS = {"us": _phone_us, "uk": _phone_uk, "intl": _phone_intl}
+
+
+# Digit sum of 2*d for d in 0-9, as used by the Luhn checksum
+_LUHN_DOUBLE = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+def _luhn_check_digit(digits: List[int]) -> int:
+    """Return the digit that makes digits + [check] pass the Luhn test."""
+    # With the check digit appended, the last payload digit is doubled
+    total = sum(digits[-2::-2])
+    for d in digits[-1::-2]:
+        total += _LUHN_DOUBLE[d]
+    return (10 - total % 10) % 10
+
+
+def _random_digits(rng: random.Random, count: int) -> str:
+    """Draw count uniform decimal digits with a single PRNG call."""
+    return str(rng.randrange(10 ** count)).zfill(count)
+
+
+class _Address(NamedTuple):
+    """Fields of a generated address, before formatting."""
+
+    street: str
+    city: str
+    state: str
+    postal_code: str
+    country: str
+
+
+# Upper bound on memoized outputs per generator; least recently used go first
+_MEMO_MAX_ENTRIES = 65536
+
+
+def _memoized(method: Callable[..., _T]) -> Callable[..., _T]:
+    """
+    Memoize a seeded generator method per (method, original, arguments).
+
+    Seeded output is fully determined by the seed, locale, str(original) and
+    arguments, so repeated values in a document skip the seeding and drawing.
+    The key uses str(original) like the seed does, so 1 and True never share
+    an entry. Calls without an original draw from the shared stream, and
+    calls with unhashable arguments, are not cached.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: "FakeDataGenerator", original: Any = None, *args: Any, **kwargs: Any) -> _T:
+        if not original:
+            return method(self, original, *args, **kwargs)
+        key = (name, str(original), self._seed, self._locale, args, tuple(kwargs.items()))
+        memo = self._memo
+        try:
+            value = memo.get(key)
+        except TypeError:
+            return method(self, original, *args, **kwargs)
+        if value is None:
+            value = memo[key] = method(self, original, *args, **kwargs)
+            if len(memo) > _MEMO_MAX_ENTRIES:
+                memo.popitem(last=False)
+        else:
+            try:
+                memo.move_to_end(key)
+            except KeyError:
+                # Another thread evicted the key after our get(); the value
+                # is still correct, it is just no longer cached
+                pass
+        return value
+
+    return wrapper
+
+
+@lru_cache(maxsize=4096)
+def _derive_seed(seed_crc: int, input_value: str) -> int:
+    """Map (generator seed, original value) to a 32-bit seed.
+
+    seed_crc is the running CRC32 of the "<seed>:" prefix (0 without a
+    seed), so this equals crc32(f"{seed}:{input_value}") without formatting
+    the prefix on every call. Callers pass str(value): the cache compares
+    keys with ==, so 1, 1.0 and True would otherwise share an entry. Only
+    the integer is cached: Random objects are stateful, so each call still
+    gets a fresh one. CRC32 only has to spread inputs over 32 bits; unlike
+    MD5 it needs no digest, hex encoding or int parsing.
+    """
+    return zlib.crc32(input_value.encode(), seed_crc)
+
+
 class FakeDataGenerator:
     """
     Generate fake data with consistent seeding.
@@ -242,67 +399,78 @@ class FakeDataGenerator:
         self.seed = seed
         self.locale = locale
         self._rng = random.Random(seed)
-
-    def _get_seeded_random(self, input_value: str) -> random.Random:
+        self._memo: "OrderedDict[tuple, Any]" = OrderedDict()
+
+    @property
+    def seed(self) -> Optional[int]:
+        """Generator seed; setting it also precomputes the seed prefix CRC."""
+        return self._seed
+
+    @seed.setter
+    def seed(self, seed: Optional[int]) -> None:
+        self._seed = seed
+        self._seed_crc = 0 if seed is None else zlib.crc32(f"{seed}:".encode())
+
+    @property
+    def locale(self) -> str:
+        """Locale code; setting it also selects the name lists."""
+        return self._locale
+
+    @locale.setter
+    def locale(self, locale: str) -> None:
+        self._locale = locale
+        self._first_names, self._last_names = _LOCALE_NAMES.get(
+            locale[:2], (FIRST_NAMES_EN, LAST_NAMES_EN)
+        )
+
+    def _get_seeded_random(self, input_value: Any) -> random.Random:
         """Get a random generator seeded by input value."""
-        if self.seed is not None:
-            combined_seed = int(hashlib.md5(
-                f"{self.seed}:{input_value}".encode()
-            ).hexdigest()[:8], 16)
-        else:
-            combined_seed = int(hashlib.md5(input_value.encode()).hexdigest()[:8], 16)
-        return random.Random(combined_seed)
-
-    def _get_names_for_locale(self) -> tuple:
-        """Get name lists for current locale."""
-        if self.locale.startswith("es"):
-            return FIRST_NAMES_ES, LAST_NAMES_ES
-        elif self.locale.startswith("fr"):
-            return FIRST_NAMES_FR, LAST_NAMES_FR
-        elif self.locale.startswith("de"):
-            return FIRST_NAMES_DE, LAST_NAMES_DE
-        elif self.locale.startswith("ja"):
-            return FIRST_NAMES_JP, LAST_NAMES_JP
-        else:
-            return FIRST_NAMES_EN, LAST_NAMES_EN
+        return random.Random(_derive_seed(self._seed_crc, str(input_value)))
 
+    @_memoized
     def first_name(self, original: str = None) -> str:
         """Generate a fake first name."""
-        first_names, _ = self._get_names_for_locale()
         if original:
             rng = self._get_seeded_random(original)
-            return rng.choice(first_names)
-        return self._rng.choice(first_names)
+            return _choice(rng, self._first_names)
+        return _choice(self._rng, self._first_names)
 
+    @_memoized
     def last_name(self, original: str = None) -> str:
         """Generate a fake last name."""
-        _, last_names = self._get_names_for_locale()
         if original:
             rng = self._get_seeded_random(original)
-            return rng.choice(last_names)
-        return self._rng.choice(last_names)
+            return _choice(rng, self._last_names)
+        return _choice(self._rng, self._last_names)
 
+    @_memoized
     def full_name(self, original: str = None) -> str:
         """Generate a fake full name."""
         if original:
             rng = self._get_seeded_random(original)
-            first_names, last_names = self._get_names_for_locale()
-            return f"{rng.choice(first_names)} {rng.choice(last_names)}"
+            return f"{_choice(rng, self._first_names)} {_choice(rng, self._last_names)}"
 
         return f"{self.first_name()} {self.last_name()}"
 
+    @_memoized
     def email(self, original: str = None) -> str:
         """Generate a fake email address."""
         if original:
             rng = self._get_seeded_random(original)
-            name = ''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=8))
-            domain = rng.choice(EMAIL_DOMAINS)
-            return f"{name}@{domain}"
+        else:
+            rng = self._rng
 
-        name = ''.join(self._rng.choices('abcdefghijklmnopqrstuvwxyz', k=8))
-        domain = self._rng.choice(EMAIL_DOMAINS)
+        # One draw covers all eight letters: its base-26 digits, low first
+        n = rng.randrange(_EMAIL_NAME_SPACE)
+        letters = []
+        for _ in range(8):
+            n, i = divmod(n, 26)
+            letters.append(_LOWERCASE[i])
+        name = ''.join(letters)
+        domain = _choice(rng, EMAIL_DOMAINS)
         return f"{name}@{domain}"
 
+    @_memoized
     def phone(self, original: str = None, format: str = "us") -> str:
         """Generate a fake phone number."""
         if original:
@@ -310,22 +478,9 @@ class FakeDataGenerator:
         else:
             rng = self._rng
 
-        if format == "us":
-            area = rng.randint(200, 999)
-            exchange = rng.randint(200, 999)
-            subscriber = rng.randint(1000, 9999)
-            return f"+1-{area}-{exchange}-{subscriber}"
-        elif format == "uk":
-            area = rng.randint(20, 79)
-            number = rng.randint(10000000, 99999999)
-            return f"+44-{area}-{number}"
-        elif format == "intl":
-            country = rng.randint(1, 99)
-            number = rng.randint(1000000000, 9999999999)
-            return f"+{country}-{number}"
-        else:
-            return f"+1-555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
+        return _PHONE_FORMATS.get(format, _phone_default)(rng)
 
+    @_memoized
     def ssn(self, original: str = None) -> str:
         """Generate a fake SSN."""
         if original:
@@ -340,49 +495,56 @@ class FakeDataGenerator:
         serial = rng.randint(1000, 9999)
         return f"{area}-{group}-{serial}"
 
-    def address(self, original: str = None) -> Dict[str, str]:
-        """Generate a fake address."""
+    @_memoized
+    def _address_fields(self, original: str = None) -> "_Address":
+        """Draw the parts of a fake address."""
         if original:
             rng = self._get_seeded_random(original)
         else:
             rng = self._rng
 
         if self.locale.startswith("en_GB"):
-            city, county, postal = rng.choice(UK_CITIES)
-            postal = f"{postal} {rng.randint(1, 9)}{rng.choice('ABCDEFGHJKLMNPRSTUVWXY')}{rng.choice('ABCDEFGHJKLMNPRSTUVWXY')}"
+            city, county, postal = _choice(rng, UK_CITIES)
+            postal = f"{postal} {rng.randint(1, 9)}{_choice(rng, 'ABCDEFGHJKLMNPRSTUVWXY')}{_choice(rng, 'ABCDEFGHJKLMNPRSTUVWXY')}"
             country = "UK"
             state = county
         elif self.locale.startswith("en_CA") or self.locale.startswith("fr_CA"):
-            city, province, postal = rng.choice(CA_CITIES)
-            postal = f"{postal} {rng.randint(1, 9)}{rng.choice('ABCEGHJKLMNPRSTVWXYZ')}{rng.randint(1, 9)}"
+            city, province, postal = _choice(rng, CA_CITIES)
+            postal = f"{postal} {rng.randint(1, 9)}{_choice(rng, 'ABCEGHJKLMNPRSTVWXYZ')}{rng.randint(1, 9)}"
             country = "Canada"
             state = province
         else:
-            city, state, postal = rng.choice(US_CITIES)
-            postal = str(int(postal) + rng.randint(0, 99))
+            city, state, base_postal = _choice(rng, _US_CITIES_INT)
+            postal = str(base_postal + rng.randint(0, 99))
             country = "USA"
 
         street_num = rng.randint(1, 9999)
-        street_name = rng.choice(STREET_NAMES)
-        street_suffix = rng.choice(STREET_SUFFIXES)
+        street_name = _choice(rng, STREET_NAMES)
+        street_suffix = _choice(rng, STREET_SUFFIXES)
+
+        return _Address(f"{street_num} {street_name} {street_suffix}", city, state, postal, country)
 
+    def address(self, original: str = None) -> Dict[str, str]:
+        """Generate a fake address."""
+        street, city, state, postal, country = self._address_fields(original)
         return {
-            "street": f"{street_num} {street_name} {street_suffix}",
+            "street": street,
             "city": city,
             "state": state,
             "postal_code": postal,
             "country": country,
-            "full": f"{street_num} {street_name} {street_suffix}, {city}, {state} {postal}",
+            "full": f"{street}, {city}, {state} {postal}",
         }
 
     def street_address(self, original: str = None) -> str:
         """Generate a fake street address."""
-        return self.address(original)["street"]
+        return self._address_fields(original).street
 
     def city(self, original: str = None) -> str:
         """Generate a fake city name."""
-        return self.address(original)["city"]
+        return self._address_fields(original).city
 
+    @_memoized
     def company(self, original: str = None) -> str:
         """Generate a fake company name."""
         if original:
@@ -391,15 +553,16 @@ class FakeDataGenerator:
             rng = self._rng
 
         if rng.random() < 0.3:
-            prefix = rng.choice(COMPANY_PREFIXES) + " "
+            prefix = _choice(rng, COMPANY_PREFIXES) + " "
         else:
             prefix = ""
 
-        base = rng.choice(COMPANY_BASES)
-        suffix = rng.choice(COMPANY_SUFFIXES)
+        base = _choice(rng, COMPANY_BASES)
+        suffix = _choice(rng, COMPANY_SUFFIXES)
 
         return f"{prefix}{base} {suffix}"
 
+    @_memoized
     def date(self, original: str = None, min_year: int = 1950, max_year: int = 2005) -> str:
         """Generate a fake date."""
         if original:
@@ -407,12 +570,12 @@ class FakeDataGenerator:
         else:
             rng = self._rng
 
-        year = rng.randint(min_year, max_year)
-        month = rng.randint(1, 12)
-        day = rng.randint(1, 28)
-
-        return f"{year}-{month:02d}-{day:02d}"
+        # One draw over every (year, month, day) combination
+        n, day = divmod(rng.randrange((max_year - min_year + 1) * 336), 28)
+        year_offset, month = divmod(n, 12)
+        return f"{min_year + year_offset}-{_MONTHS[month]}-{_DAYS[day]}"
 
+    @_memoized
     def credit_card(self, original: str = None) -> str:
         """Generate a fake credit card number (Luhn-valid test number)."""
         if original:
@@ -420,32 +583,24 @@ class FakeDataGenerator:
         else:
             rng = self._rng
 
-        prefix = rng.choice(["4", "5", "37", "6011"])
+        prefix = _choice(rng, ("4", "5", "37", "6011"))
 
         if prefix == "4":
-            numbers = [int(d) for d in prefix + ''.join(str(rng.randint(0, 9)) for _ in range(14))]
+            payload = prefix + _random_digits(rng, 14)
         elif prefix == "5":
-            numbers = [int(d) for d in prefix + str(rng.randint(1, 5)) + ''.join(str(rng.randint(0, 9)) for _ in range(13))]
-        elif prefix == "37":
-            numbers = [int(d) for d in prefix + ''.join(str(rng.randint(0, 9)) for _ in range(12))]
+            payload = prefix + str(rng.randint(1, 5)) + _random_digits(rng, 13)
         else:
-            numbers = [int(d) for d in prefix + ''.join(str(rng.randint(0, 9)) for _ in range(12))]
-
-        def luhn_checksum(digits):
-            odd_sum = sum(digits[-1::-2])
-            even_sum = sum(sum(divmod(2 * d, 10)) for d in digits[-2::-2])
-            return (10 - (odd_sum + even_sum) % 10) % 10
+            payload = prefix + _random_digits(rng, 12)
+        numbers = list(map(int, payload))
 
-        check = luhn_checksum(numbers + [0])
-        numbers.append(check)
-
-        result = ''.join(str(d) for d in numbers)
+        result = payload + str(_luhn_check_digit(numbers))
         if len(result) == 16:
             return f"{result[:4]} {result[4:8]} {result[8:12]} {result[12:]}"
         elif len(result) == 15:
             return f"{result[:4]} {result[4:10]} {result[10:]}"
         return result
 
+    @_memoized
     def ip_address(self, original: str = None, version: int = 4) -> str:
         """Generate a fake IP address."""
         if original:
@@ -454,12 +609,17 @@ class FakeDataGenerator:
             rng = self._rng
 
         if version == 4:
-            first = rng.choice([10, 172, 192, rng.randint(1, 223)])
-            return f"{first}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}"
+            first = _choice(rng, (10, 172, 192, rng.randint(1, 223)))
+            # One draw for the last three octets (0-255, 0-255, 1-254)
+            n, fourth = divmod(rng.randrange(256 * 256 * 254), 254)
+            second, third = divmod(n, 256)
+            return f"{first}.{second}.{third}.{fourth + 1}"
         else:
-            segments = [format(rng.randint(0, 65535), 'x') for _ in range(8)]
-            return ':'.join(segments)
+            # One 128-bit draw split into eight 16-bit groups
+            groups = _unpack_ipv6_groups(rng.getrandbits(128).to_bytes(16, "big"))
+            return _IPV6_FORMAT % groups
 
+    @_memoized
     def username(self, original: str = None) -> str:
         """Generate a fake username."""
         if original:
@@ -467,25 +627,54 @@ class FakeDataGenerator:
         else:
             rng = self._rng
 
-        first_names, last_names = self._get_names_for_locale()
-
-        patterns = [
-            lambda: f"{rng.choice(first_names).lower()}{rng.randint(1, 999)}",
-            lambda: f"{rng.choice(first_names).lower()}_{rng.choice(last_names).lower()}",
-            lambda: f"{rng.choice(first_names).lower()[0]}{rng.choice(last_names).lower()}",
-            lambda: f"{rng.choice(last_names).lower()}{rng.randint(10, 99)}",
-        ]
+        first_names, last_names = self._first_names, self._last_names
 
-        return rng.choice(patterns)()
+        # Pick one of four formats; randrange(4) draws the same value that
+        # choice() over a 4-item list would
+        pattern = rng.randrange(4)
+        if pattern == 0:
+            return f"{_choice(rng, first_names).lower()}{rng.randint(1, 999)}"
+        elif pattern == 1:
+            return f"{_choice(rng, first_names).lower()}_{_choice(rng, last_names).lower()}"
+        elif pattern == 2:
+            return f"{_choice(rng, first_names).lower()[0]}{_choice(rng, last_names).lower()}"
+        return f"{_choice(rng, last_names).lower()}{rng.randint(10, 99)}"
 
 
 # Global instance
 _default_generator: Optional[FakeDataGenerator] = None
 
+# Upper bound on (seed, locale) pairs whose memo outlives its generator
+_SHARED_MEMOS_MAX = 16
+_shared_memos: "OrderedDict[tuple, OrderedDict[tuple, Any]]" = OrderedDict()
+_shared_memos_lock = threading.Lock()
+
+
+def _shared_memo(seed: Optional[int], locale: str) -> "OrderedDict[tuple, Any]":
+    """Return the memo shared by seeded generators with this seed and locale."""
+    key = (seed, locale)
+    with _shared_memos_lock:
+        memo = _shared_memos.get(key)
+        if memo is None:
+            memo = _shared_memos[key] = OrderedDict()
+            if len(_shared_memos) > _SHARED_MEMOS_MAX:
+                _shared_memos.popitem(last=False)
+        else:
+            _shared_memos.move_to_end(key)
+    return memo
+
 
 def get_fake_generator(seed: int = None, locale: str = "en_US") -> FakeDataGenerator:
-    """Get fake data generator."""
+    """
+    Get fake data generator.
+
+    A seeded call always returns a fresh generator, so its stream restarts.
+    Memoized original-based outputs depend only on seed, locale and original,
+    so seeded generators share them per (seed, locale).
+    """
     global _default_generator
     if _default_generator is None or seed is not None:
         _default_generator = FakeDataGenerator(seed=seed, locale=locale)
+        if seed is not None:
+            _default_generator._memo = _shared_memo(seed, locale)
     return _default_generator
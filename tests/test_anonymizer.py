@@ -10,7 +10,15 @@ from pii_guard import (
     TokenVault,
     AnonymizationTemplates,
 )
-from pii_guard.fake_data import FakeDataGenerator
+from pii_guard.anonymizer import Anonymizer
+from pii_guard.fake_data import FakeDataGenerator, get_fake_generator
+
+
+class UpperAnonymizer(Anonymizer):
+    """Anonymizer that upper-cases values, for registry override tests."""
+
+    def anonymize(self, value, config, context=None):
+        return None if value is None else str(value).upper()
 
 
 class TestAnonymizationMethods:
@@ -270,6 +278,60 @@ class TestDataAnonymizer:
         assert stats.original_count == 3
         assert stats.anonymized_count == 3
 
+    def test_anonymize_records_parallel(self):
+        """Test that parallel batch anonymization matches the sequential result."""
+        config = AnonymizationConfig(
+            config_id="test",
+            name="Test",
+            tables=[
+                TableConfig(
+                    table_name="users",
+                    fields=[
+                        FieldConfig("email", "email", AnonymizationMethod.HASH),
+                        FieldConfig("phone", "phone", AnonymizationMethod.MASK),
+                    ]
+                )
+            ]
+        )
+        records = [
+            {"email": f"user{i % 7}@example.com", "phone": f"555-000-{i:04d}"}
+            for i in range(50)
+        ]
+        records[20] = None
+
+        expected, expected_stats = DataAnonymizer(config).anonymize_records(records, "users")
+        results, stats = DataAnonymizer(config).anonymize_records_parallel(
+            records, "users", workers=2, chunk_size=16
+        )
+
+        assert results == expected
+        assert stats.fields_processed == expected_stats.fields_processed
+        assert stats.errors == expected_stats.errors
+
+    def test_anonymize_records_parallel_uses_replaced_anonymizers(self):
+        """Test that parallel workers apply replacements made in anonymizers."""
+        config = AnonymizationConfig(
+            config_id="test",
+            name="Test",
+            tables=[
+                TableConfig(
+                    table_name="users",
+                    fields=[
+                        FieldConfig("email", "email", AnonymizationMethod.MASK),
+                    ]
+                )
+            ]
+        )
+        records = [{"email": f"user{i}@example.com"} for i in range(40)]
+        anonymizer = DataAnonymizer(config)
+        anonymizer.anonymizers["email"] = UpperAnonymizer()
+
+        results, _ = anonymizer.anonymize_records_parallel(
+            records, "users", workers=2, chunk_size=16
+        )
+
+        assert [r["email"] for r in results] == [r["email"].upper() for r in records]
+
     def test_preserve_nulls(self):
         """Test that null values are preserved."""
         config = AnonymizationConfig(
@@ -291,6 +353,78 @@ class TestDataAnonymizer:
 
         assert result["email"] is None
 
+    def test_anonymize_record_inplace(self):
+        """Test in-place anonymization overwrites only configured fields."""
+        config = AnonymizationConfig(
+            config_id="test",
+            name="Test",
+            tables=[
+                TableConfig(
+                    table_name="users",
+                    fields=[
+                        FieldConfig("email", "email", AnonymizationMethod.REDACT),
+                        FieldConfig("phone", "phone", AnonymizationMethod.MASK),
+                    ]
+                )
+            ]
+        )
+        anonymizer = DataAnonymizer(config)
+        record = {"id": 1, "email": "john@example.com", "phone": "555-123-4567"}
+        expected = anonymizer.anonymize_record(dict(record), "users")
+        result = anonymizer.anonymize_record_inplace(record, "users")
+
+        assert result is record
+        assert result == expected
+        assert result["id"] == 1
+
+    def test_replaced_anonymizer_is_used(self):
+        """Test that replacing an entry in anonymizers takes effect."""
+        config = AnonymizationConfig(
+            config_id="test",
+            name="Test",
+            tables=[
+                TableConfig(
+                    table_name="users",
+                    fields=[
+                        FieldConfig("email", "email", AnonymizationMethod.MASK),
+                    ]
+                )
+            ]
+        )
+        record = {"email": "john@x.com"}
+
+        # Fresh instances, so no path is answered from another's cache
+        anonymizers = [DataAnonymizer(config) for _ in range(3)]
+        for anonymizer in anonymizers:
+            anonymizer.anonymizers["email"] = UpperAnonymizer()
+        results, _ = anonymizers[2].anonymize_records([record], "users")
+
+        assert anonymizers[0].anonymize_record(record, "users")["email"] == "JOHN@X.COM"
+        assert anonymizers[1].anonymize_record_inplace(dict(record), "users")["email"] == "JOHN@X.COM"
+        assert results[0]["email"] == "JOHN@X.COM"
+
+    def test_changed_params_apply_to_every_path(self):
+        """Test that params changed after construction reach all record paths."""
+        config = AnonymizationConfig(
+            config_id="test",
+            name="Test",
+            tables=[
+                TableConfig(
+                    table_name="users",
+                    fields=[
+                        FieldConfig("phone", "phone", AnonymizationMethod.MASK),
+                    ]
+                )
+            ]
+        )
+        anonymizers = [DataAnonymizer(config) for _ in range(2)]
+        config.tables[0].fields[0].params["show_last"] = 2
+        record = {"phone": "555-123-4567"}
+        results, _ = anonymizers[1].anonymize_records([record], "users")
+
+        assert anonymizers[0].anonymize_record(record, "users")["phone"] == "********67"
+        assert results[0]["phone"] == "********67"
+
     def test_consistency_across_records(self):
         """Test that same value gets same anonymization."""
         config = AnonymizationConfig(
@@ -457,6 +591,43 @@ class TestFakeDataGenerator:
 
         assert fake1 == fake2
 
+    def test_original_based_consistency_follows_locale(self):
+        """Test that repeated originals track locale changes."""
+        faker = FakeDataGenerator(seed=42, locale="en_US")
+        fresh_de = FakeDataGenerator(seed=42, locale="de_DE")
+
+        faker.full_name("John Smith")
+        faker.locale = "de_DE"
+
+        assert faker.full_name("John Smith") == fresh_de.full_name("John Smith")
+
+    def test_non_string_original(self):
+        """Test that a non-string original seeds like its string form."""
+        faker = FakeDataGenerator(seed=1)
+
+        assert faker.full_name(12345) == FakeDataGenerator(seed=1).full_name("12345")
+
+        # Equal values of other types must not reuse the entry cached for 1
+        faker.full_name(1)
+        assert faker.full_name(True) == FakeDataGenerator(seed=1).full_name("True")
+        assert faker.full_name(1.0) == FakeDataGenerator(seed=1).full_name("1.0")
+
+    def test_seeded_output_ignores_call_history(self):
+        """Test that earlier calls with equal non-string values don't leak."""
+        expected = FakeDataGenerator(seed=5).full_name("True")
+        FakeDataGenerator(seed=5).full_name(1)
+
+        assert FakeDataGenerator(seed=5).full_name(True) == expected
+        assert FakeDataGenerator(seed=5).full_name(["a"]) == FakeDataGenerator(seed=5).full_name("['a']")
+
+    def test_get_fake_generator_seeded_is_reproducible(self):
+        """Test each seeded get_fake_generator() call restarts the stream."""
+        first = get_fake_generator(seed=42).first_name()
+
+        assert get_fake_generator(seed=42).first_name() == first
+        assert get_fake_generator(seed=42) is not get_fake_generator(seed=42)
+        assert get_fake_generator(seed=42, locale="de_DE").locale == "de_DE"
+
     def test_different_locales(self):
         """Test different locale support."""
         faker_es = FakeDataGenerator(locale="es_ES")
@@ -1,17 +1,18 @@
 """Tests for PII detection functionality."""
 
 import pytest
-from pii_guard import PIIDetector, scan, redact, list_entities, PIIEntity
+from pii_guard import PIIDetector, scan, redact, list_entities, PIIEntity, get_default_detector
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """Create one detector instance for the module; detect() keeps no state."""
+    return PIIDetector()
 
 
 class TestPIIDetector:
     """Tests for the PIIDetector class."""
 
-    @pytest.fixture
-    def detector(self):
-        """Create a detector instance for tests."""
-        return PIIDetector()
-
     def test_detector_initialization(self, detector):
         """Test that detector initializes correctly."""
         assert detector is not None
@@ -182,6 +183,11 @@ class TestConvenienceFunctions:
         assert len(entities) >= 1
         assert all(isinstance(e, PIIEntity) for e in entities)
 
+    def test_entity_dict_round_trip(self):
+        """Test PIIEntity.from_dict() restores every field of to_dict()."""
+        for entity in scan("Email me at test@example.com or call 555-123-4567"):
+            assert PIIEntity.from_dict(entity.to_dict()) == entity
+
     def test_redact_function(self):
         """Test the redact() convenience function."""
         result = redact("SSN: 123-45-6789")
@@ -190,6 +196,13 @@ class TestConvenienceFunctions:
         assert "123-45-6789" not in result
         assert "[SSN:" in result
 
+    def test_default_detector_is_shared(self):
+        """Test get_default_detector() returns one shared instance."""
+        detector = get_default_detector()
+
+        assert isinstance(detector, PIIDetector)
+        assert get_default_detector() is detector
+
     def test_list_entities_function(self):
         """Test the list_entities() convenience function."""
         entities = list_entities()
@@ -204,10 +217,6 @@ class TestConvenienceFunctions:
 class TestValidators:
     """Tests for built-in validators."""
 
-    @pytest.fixture
-    def detector(self):
-        return PIIDetector()
-
     def test_luhn_valid(self, detector):
         """Test Luhn algorithm with valid card."""
         assert detector._luhn_check("4532015112830366") is True
@@ -265,10 +274,6 @@ class TestValidators:
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
-    @pytest.fixture
-    def detector(self):
-        return PIIDetector()
-
     def test_empty_string(self, detector):
         """Test with empty string."""
         entities = detector.detect("")
@@ -279,6 +284,11 @@ class TestEdgeCases:
         entities = detector.detect("   \n\t  ")
         assert entities == []
 
+    def test_no_letters_or_digits(self, detector):
+        """Test text without letters, digits or @ is skipped."""
+        assert detector.detect("--- *** ...") == []
+        assert detector.detect("こんにちは") == []
+
     def test_unicode_text(self, detector):
         """Test with unicode text."""
         text = "Contact 田中太郎 at email@example.com"